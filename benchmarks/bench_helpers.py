@@ -0,0 +1,192 @@
+"""Benchmark the hot test helpers against the local copy of the app.
+
+Runs login, logout, navigate_to_page, navigate_to_login and
+take_screenshot many times each, with a fresh app state before every
+iteration, and reports median and p95 latency. Only the helper call is
+timed; the per-iteration setup is not.
+
+With --save-baseline the results become the new baseline. Otherwise they
+are compared against benchmarks/baseline_helpers.json and the script exits
+with status 1 if any helper's median got slower than the baseline by more
+than --threshold, or if the baseline or a helper's entry in it is missing.
+A helper that raises or reports failure stops the run with status 1, so a
+broken helper is never timed as a slow one.
+
+Usage:
+    python benchmarks/bench_helpers.py --save-baseline
+    python benchmarks/bench_helpers.py --iterations 30 --threshold 0.25
+    python benchmarks/bench_helpers.py --helpers login logout --profile ci-fast
+"""
+import argparse
+import atexit
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cleancity_testkit import (  # noqa: E402
+    budget, instrumentation, locators, profiles, resources, screenshots, server, session,
+)
+
+RESULTS_FILE = os.path.join(ROOT, 'benchmarks', 'results', 'helpers.json')
+BASELINE_FILE = os.path.join(ROOT, 'benchmarks', 'baseline_helpers.json')
+
+
+class HelperFailed(Exception):
+    """A helper or its setup failed, so there is nothing meaningful to time"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def build_cases(bench):
+    """{helper name: (prepare, run)}; prepare is untimed, run is the measured call"""
+    def register_user():
+        bench.setUp()
+        user = session.make_user({'email': 'bench@example.com'})
+        # Registered but not logged in, so login() has someone to log in as
+        bench.driver.execute_script(session.INJECT_SESSION_SCRIPT, user, list(session.USER_LIST_KEYS), {})
+        bench.driver.get(bench.base_url)
+
+    def logged_in():
+        bench.setUp()
+        return bench.login_fast()
+
+    return {
+        'login': (register_user, lambda: bench.login('bench@example.com', session.DEFAULT_USER['password'])),
+        'logout': (logged_in, bench.logout),
+        'navigate_to_page': (bench.setUp, lambda: bench.navigate_to_page('Awareness')),
+        'navigate_to_login': (bench.setUp, bench.navigate_to_login),
+        # Tests only pay for the capture; the write happens on the writer threads
+        'take_screenshot': (screenshots.flush, lambda: bench.take_screenshot('bench')),
+    }
+
+
+def finish_kit():
+    """Run the kit's exit-time saves and reports now, so they land in the current directory"""
+    for finish in (screenshots._finish, locators._finish, budget._finish, resources._finish,
+                   instrumentation._finish):
+        atexit.unregister(finish)
+        finish()
+
+
+def run(helpers, iterations, warmup):
+    """Return {helper: [seconds, ...]}"""
+    import test_cleancity_ui
+
+    class HelperBench(test_cleancity_ui.CleanCityBaseTest):
+        def runTest(self):
+            pass
+
+    HelperBench.setUpClass()
+    bench = HelperBench()
+    cases = build_cases(bench)
+    samples = {}
+    for name in helpers:
+        prepare, call = cases[name]
+        print(f"--- {name}: {warmup} warmup + {iterations} timed runs ---")
+        samples[name] = []
+        for i in range(warmup + iterations):
+            # Helpers log and return False instead of raising, so check the result too
+            if prepare() is False:
+                raise HelperFailed(f"{name}: setup failed on run {i + 1}")
+            start = time.perf_counter()
+            result = call()
+            elapsed = time.perf_counter() - start
+            if result is False or result is None:
+                raise HelperFailed(f"{name}: helper failed on run {i + 1} after {elapsed * 1000:.0f} ms")
+            if i >= warmup:
+                samples[name].append(elapsed)
+    screenshots.flush()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--helpers', nargs='+', default=['login', 'logout', 'navigate_to_page',
+                                                         'navigate_to_login', 'take_screenshot'])
+    parser.add_argument('--iterations', type=int, default=20, help='Timed runs per helper')
+    parser.add_argument('--warmup', type=int, default=2, help='Untimed runs per helper before timing')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed median slowdown vs baseline as a fraction (default 0.2 = 20%%)')
+    parser.add_argument('--profile', default='ci-fast', choices=sorted(profiles.PROFILES))
+    parser.add_argument('--save-baseline', action='store_true', help=f'Write results to {BASELINE_FILE}')
+    args = parser.parse_args()
+
+    os.environ[profiles.PROFILE_ENV_VAR] = args.profile
+    # Always measure against the local app, never a deployed site
+    os.environ.pop(server.BASE_URL_ENV_VAR, None)
+
+    # Keep the log file, screenshots and caches the helpers write out of the repository
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            samples = run(args.helpers, args.iterations, args.warmup)
+        except Exception as e:
+            print(f"\nBENCHMARK FAILED: {str(e)}")
+            sys.exit(1)
+        finally:
+            # The locator cache, budget report and the rest would otherwise
+            # be written at exit, after we are back in the repository
+            finish_kit()
+            os.chdir(ROOT)
+
+    results = {
+        name: {'median': statistics.median(values), 'p95': percentile(values, 0.95), 'runs': len(values)}
+        for name, values in samples.items()
+    }
+
+    baseline = {}
+    regressions = []
+    if not args.save_baseline:
+        if not os.path.exists(BASELINE_FILE):
+            regressions.append(f"no baseline at {BASELINE_FILE}; record one with --save-baseline")
+        else:
+            with open(BASELINE_FILE) as f:
+                saved = json.load(f)
+            if saved.get('profile') != args.profile:
+                print(f"Warning: baseline was recorded with profile '{saved.get('profile')}', not '{args.profile}'")
+            baseline = saved['helpers']
+
+    print("\n=== HELPER LATENCY (ms) ===")
+    print("helper".ljust(20) + "median".rjust(10) + "p95".rjust(10) + "baseline".rjust(10) + "change".rjust(10))
+    for name, result in results.items():
+        row = name.ljust(20) + f"{result['median'] * 1000:.1f}".rjust(10) + f"{result['p95'] * 1000:.1f}".rjust(10)
+        if name in baseline:
+            reference = baseline[name]['median']
+            change = result['median'] / reference - 1 if reference else 0.0
+            row += f"{reference * 1000:.1f}".rjust(10) + f"{change:+.0%}".rjust(10)
+            if change > args.threshold:
+                regressions.append(f"{name}: median {result['median'] * 1000:.1f} ms is {change:.0%} slower "
+                                   f"than baseline {reference * 1000:.1f} ms")
+        elif baseline:
+            regressions.append(f"{name}: not in the baseline; record it with --save-baseline")
+        print(row)
+
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump({'profile': args.profile, 'helpers': results}, f, indent=2)
+    print(f"Results written to {RESULTS_FILE}")
+
+    if args.save_baseline:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump({'profile': args.profile, 'helpers': results}, f, indent=2)
+        print(f"Baseline saved to {BASELINE_FILE}")
+    elif regressions:
+        print(f"\nREGRESSIONS (threshold {args.threshold:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
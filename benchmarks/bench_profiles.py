@@ -0,0 +1,90 @@
+"""Compare per-test wall-clock time across Chrome run profiles.
+
+Runs the UI suite once per profile (optionally several times), reads the
+per-test durations from pytest's JUnit XML and prints a side-by-side table.
+
+Usage:
+    python benchmarks/bench_profiles.py
+    python benchmarks/bench_profiles.py --profiles debug-visible ci-fast --repeat 3 -k TestLoginFunctionality
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cleancity_testkit import profiles  # noqa: E402
+
+RESULTS_FILE = os.path.join(ROOT, 'benchmarks', 'results', 'profiles.json')
+
+
+def run_suite(profile, keyword, report_path):
+    """Run the suite with a profile and return {test_id: seconds}"""
+    command = [sys.executable, '-m', 'pytest', 'test_cleancity_ui.py', '-q',
+               '--profile', profile, f'--junitxml={report_path}']
+    if keyword:
+        command += ['-k', keyword]
+    subprocess.run(command, cwd=ROOT)
+
+    timings = {}
+    for case in ET.parse(report_path).getroot().iter('testcase'):
+        test_id = f"{case.get('classname')}::{case.get('name')}"
+        timings[test_id] = float(case.get('time', 0))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', nargs='+', default=list(profiles.PROFILES),
+                        choices=sorted(profiles.PROFILES))
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per profile (median is reported)')
+    parser.add_argument('-k', dest='keyword', default=None, help='pytest -k expression')
+    args = parser.parse_args()
+
+    # {profile: {test_id: [seconds, ...]}}
+    samples = {name: {} for name in args.profiles}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for run in range(args.repeat):
+            for name in args.profiles:
+                print(f"--- Run {run + 1}/{args.repeat}: profile '{name}' ---")
+                report_path = os.path.join(tmp_dir, f'{name}_{run}.xml')
+                for test_id, seconds in run_suite(name, args.keyword, report_path).items():
+                    samples[name].setdefault(test_id, []).append(seconds)
+
+    medians = {
+        name: {test_id: statistics.median(values) for test_id, values in tests.items()}
+        for name, tests in samples.items()
+    }
+
+    test_ids = sorted({test_id for tests in medians.values() for test_id in tests})
+    width = max([len(t) for t in test_ids] + [10])
+    print("\n=== PER-TEST MEDIAN SECONDS ===")
+    print("test".ljust(width) + "".join(name.rjust(16) for name in args.profiles))
+    for test_id in test_ids:
+        row = "".join(
+            (f"{medians[name][test_id]:.2f}" if test_id in medians[name] else "-").rjust(16)
+            for name in args.profiles
+        )
+        print(test_id.ljust(width) + row)
+    totals = {name: sum(tests.values()) for name, tests in medians.items()}
+    print("TOTAL".ljust(width) + "".join(f"{totals[name]:.2f}".rjust(16) for name in args.profiles))
+
+    baseline = args.profiles[0]
+    for name in args.profiles[1:]:
+        if totals[name]:
+            print(f"{name}: {totals[baseline] / totals[name]:.2f}x vs {baseline}")
+
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump({'repeat': args.repeat, 'medians': medians, 'totals': totals}, f, indent=2)
+    print(f"Results written to {RESULTS_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+"""Shared helpers for the CleanCity Selenium UI test suite"""
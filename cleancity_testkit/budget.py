@@ -0,0 +1,156 @@
+"""Per-test time budget that every wait draws from.
+
+Each test gets ``CLEANCITY_TEST_BUDGET`` seconds (default 120). Waits ask
+``timeout(requested)`` for their upper bound and get at most what is left
+of the test's budget, so once a test has used it up every further wait
+checks its condition once and gives up. A broken selector then costs a
+bounded amount of time instead of ten seconds per candidate.
+
+Waits and lookups that time out are recorded as failed lookups. At the
+end of each test the time spent on them is logged, and at exit the
+per-test figures are written to ``test-reports/budget.json``
+(worker-tagged under xdist).
+"""
+import atexit
+import json
+import logging
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cleancity_testkit import instrumentation, workers
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ENV_VAR = 'CLEANCITY_TEST_BUDGET'
+DEFAULT_BUDGET = 120.0
+REPORT_DIR = 'test-reports'
+
+
+def budget_seconds():
+    return float(os.environ.get(BUDGET_ENV_VAR, DEFAULT_BUDGET))
+
+
+class Budget:
+    """Deadline and failed-lookup accounting for one test"""
+
+    def __init__(self, test_id, seconds):
+        self.test_id = test_id
+        self.seconds = seconds
+        self.start = time.monotonic()
+        self.deadline = self.start + seconds
+        self.failed_lookups = []
+        self.clamped = 0
+        self.exhausted = False
+
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+    def timeout(self, requested):
+        """requested, cut down to what is left of the budget"""
+        remaining = self.remaining()
+        if requested <= remaining:
+            return requested
+        self.clamped += 1
+        if not remaining and not self.exhausted:
+            self.exhausted = True
+            logger.warning(f"{self.test_id} used its {self.seconds:g}s budget; waits now check once")
+        return remaining
+
+    def record_failure(self, name, seconds):
+        self.failed_lookups.append((name, seconds))
+
+    def summary(self):
+        failed_seconds = sum(seconds for _, seconds in self.failed_lookups)
+        worst = {}
+        for name, seconds in self.failed_lookups:
+            worst[name] = worst.get(name, 0.0) + seconds
+        return {
+            'budget_seconds': self.seconds,
+            'used_seconds': time.monotonic() - self.start,
+            'failed_lookup_seconds': failed_seconds,
+            'failed_lookups': len(self.failed_lookups),
+            'clamped_waits': self.clamped,
+            'worst_lookups': dict(sorted(worst.items(), key=lambda item: -item[1])[:5]),
+        }
+
+
+_current = None
+_results = {}
+_registered = False
+
+
+def timeout(requested):
+    """Upper bound a wait may use; unchanged outside a test"""
+    return requested if _current is None else _current.timeout(requested)
+
+
+def record_failure(name, seconds):
+    if _current is not None:
+        _current.record_failure(name, seconds)
+
+
+def begin_test(test_id, seconds=None):
+    global _current, _registered
+    _current = Budget(test_id, budget_seconds() if seconds is None else seconds)
+    if not _registered:
+        _registered = True
+        atexit.register(_finish)
+
+
+def end_test():
+    """Log how the budget was spent and keep the figures for the report"""
+    global _current
+    if _current is None:
+        return None
+    summary = _current.summary()
+    _results[_current.test_id] = summary
+    if summary['failed_lookups']:
+        share = summary['failed_lookup_seconds'] / summary['used_seconds'] if summary['used_seconds'] else 0.0
+        worst = ', '.join(f"{name} {seconds:.1f}s" for name, seconds in summary['worst_lookups'].items())
+        logger.info(f"Budget: {summary['used_seconds']:.1f}s of {summary['budget_seconds']:g}s used, "
+                    f"{summary['failed_lookup_seconds']:.1f}s ({share:.0%}) on {summary['failed_lookups']} "
+                    f"failed lookups ({worst})")
+    _current = None
+    return summary
+
+
+class BudgetWait(WebDriverWait):
+    """WebDriverWait whose timeout is cut to the running test's remaining budget"""
+
+    def until(self, method, message=''):
+        return self._bounded(super().until, method, message)
+
+    def until_not(self, method, message=''):
+        return self._bounded(super().until_not, method, message)
+
+    def _bounded(self, wait, method, message):
+        requested = self._timeout
+        # expected_conditions closures are named after their factory
+        name = getattr(method, '__qualname__', type(method).__name__).split('.<locals>')[0]
+        self._timeout = timeout(requested)
+        start = time.monotonic()
+        try:
+            with instrumentation.timed_wait(name, requested):
+                return wait(method, message)
+        except TimeoutException:
+            record_failure(name, time.monotonic() - start)
+            raise
+        finally:
+            self._timeout = requested
+
+
+def write(report_dir=REPORT_DIR):
+    os.makedirs(report_dir, exist_ok=True)
+    path = os.path.join(report_dir, workers.worker_path('budget.json'))
+    with open(path, 'w') as f:
+        json.dump(_results, f, indent=2)
+    total = sum(result['failed_lookup_seconds'] for result in _results.values())
+    logger.info(f"Failed lookups took {total:.1f}s over {len(_results)} tests; budget report written to {path}")
+
+
+def _finish():
+    if _results:
+        write()
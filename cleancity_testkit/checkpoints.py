@@ -0,0 +1,153 @@
+"""Named app-state snapshots: stage checkpoints and storage fixtures.
+
+All app state lives in the origin's localStorage and sessionStorage, so the
+state a setup step ends in (a registered user, a logged-in user with three
+pickups, the admin) is fully described by a snapshot of both plus the page
+it was on. ``save`` writes that to ``.cache/checkpoints/<name>.json``;
+``restore`` writes the storage back and loads the page in one script call.
+Snapshot files are shared by xdist workers and kept across runs. Each one
+records the ``build`` key it was saved under (see ``build_key``) and
+``load`` ignores it once the key changes, so a new app build or different
+test accounts never resume from stale state.
+
+A storage fixture is a snapshot with a registered builder::
+
+    @checkpoints.fixture('user_with_three_pickups', version=1)
+    def build(test):
+        ...  # drive the UI
+        return {'user': user}
+
+``CleanCityBaseTest.resume_from(name)`` restores the fixture if it is saved
+and runs the builder first if not. Bump ``version`` when a builder
+changes so saved snapshots are rebuilt. ``python -m
+cleancity_testkit.checkpoints`` lists the saved snapshots; ``clear
+[name ...]`` deletes them.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = os.environ.get('CLEANCITY_CHECKPOINTS', os.path.join('.cache', 'checkpoints'))
+
+SNAPSHOT_SCRIPT = """
+function dump(storage) {
+  var data = {};
+  for (var i = 0; i < storage.length; i++) {
+    var key = storage.key(i);
+    data[key] = storage.getItem(key);
+  }
+  return data;
+}
+return [dump(localStorage), dump(sessionStorage)];
+"""
+
+RESTORE_SCRIPT = """
+function load(storage, data) {
+  storage.clear();
+  Object.keys(data).forEach(function (key) { storage.setItem(key, data[key]); });
+}
+load(localStorage, arguments[0]);
+load(sessionStorage, arguments[1]);
+location.replace(arguments[2]);
+"""
+
+# Storage fixture name -> (builder(test) returning metadata or None, version)
+FIXTURES = {}
+
+
+def fixture(name, version=1):
+    """Register the decorated function as the builder of storage fixture name"""
+    def register(builder):
+        FIXTURES[name] = (builder, version)
+        return builder
+    return register
+
+
+def checkpoint_path(name, checkpoint_dir=CHECKPOINT_DIR):
+    return os.path.join(checkpoint_dir, f"{name}.json")
+
+
+def build_key(*parts):
+    """Short hash of what a checkpoint is only valid for, such as the app build and test accounts"""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()[:12]
+
+
+def save(driver, name, meta=None, build=None, checkpoint_dir=CHECKPOINT_DIR):
+    """Snapshot both storages and the current page as checkpoint name, valid for build"""
+    url = urlparse(driver.current_url)
+    local_storage, session_storage = driver.execute_script(SNAPSHOT_SCRIPT)
+    checkpoint = {
+        'storage': local_storage,
+        'session_storage': session_storage,
+        'route': url.path + (f"#{url.fragment}" if url.fragment else ''),
+        'saved_at': time.time(),
+        'version': FIXTURES[name][1] if name in FIXTURES else None,
+        'build': build,
+        'meta': meta or {},
+    }
+    path = checkpoint_path(name, checkpoint_dir)
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+    logger.info(f"Checkpoint '{name}' saved ({len(local_storage)} keys, route {checkpoint['route']})")
+    return checkpoint
+
+
+def load(name, build=None, checkpoint_dir=CHECKPOINT_DIR):
+    """The saved checkpoint, or None if there is none, it was saved for another build or its fixture builder changed"""
+    try:
+        with open(checkpoint_path(name, checkpoint_dir)) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get('build') != build:
+        logger.info(f"Checkpoint '{name}' was saved for another app build or account, ignoring it")
+        return None
+    if name in FIXTURES and checkpoint.get('version') != FIXTURES[name][1]:
+        logger.info(f"Checkpoint '{name}' was saved by an older builder, ignoring it")
+        return None
+    return checkpoint
+
+
+def restore(driver, base_url, checkpoint):
+    """Replace the origin's storage with the checkpoint's and load its page"""
+    origin = base_url.rstrip('/')
+    # Storage is per origin, so we must be on the app before writing
+    if not driver.current_url.startswith(origin):
+        driver.get(base_url)
+    # chromedriver waits for the navigation the script starts before the next command
+    driver.execute_script(RESTORE_SCRIPT, checkpoint['storage'], checkpoint.get('session_storage', {}),
+                          origin + checkpoint['route'])
+
+
+def main(command='list', *names, checkpoint_dir=CHECKPOINT_DIR):
+    paths = sorted(entry.path for entry in os.scandir(checkpoint_dir)
+                   if entry.name.endswith('.json')) if os.path.isdir(checkpoint_dir) else []
+    if names:
+        paths = [path for path in paths if os.path.basename(path)[:-5] in names]
+    if command == 'clear':
+        for path in paths:
+            os.remove(path)
+        print(f"Removed {len(paths)} checkpoints from {checkpoint_dir}")
+        return
+    if not paths:
+        print(f"No checkpoints saved in {checkpoint_dir}")
+        return
+    for path in paths:
+        with open(path) as f:
+            checkpoint = json.load(f)
+        saved = time.strftime('%Y-%m-%d %H:%M', time.localtime(checkpoint['saved_at']))
+        print(f"{os.path.basename(path)[:-5]}: {len(checkpoint['storage'])} keys, "
+              f"route {checkpoint['route']}, build {checkpoint.get('build')}, saved {saved}")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,123 @@
+"""Offline chromedriver resolution backed by a small on-disk cache.
+
+``ChromeDriverManager().install()`` checks versions over the network every
+time it is called. The first run resolves a driver the usual way and
+records its path together with the installed Chrome version; later runs
+reuse that path without touching the network until Chrome's major version
+changes.
+"""
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.environ.get(
+    'CLEANCITY_DRIVER_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'cleancity', 'chromedriver.json')
+)
+
+# Commands that print the installed Chrome version, tried in order
+CHROME_VERSION_COMMANDS = {
+    'linux': [
+        ['google-chrome', '--version'],
+        ['google-chrome-stable', '--version'],
+        ['chromium', '--version'],
+        ['chromium-browser', '--version'],
+    ],
+    'darwin': [
+        ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'],
+        ['/Applications/Chromium.app/Contents/MacOS/Chromium', '--version'],
+    ],
+}
+
+VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+(?:\.\d+)?')
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string, or None if unknown"""
+    if sys.platform.startswith('win'):
+        return _detect_windows_chrome_version()
+    platform = 'darwin' if sys.platform == 'darwin' else 'linux'
+    for command in CHROME_VERSION_COMMANDS[platform]:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = VERSION_PATTERN.search(output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _detect_windows_chrome_version():
+    """Read the Chrome version from the Windows registry"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r'Software\Google\Chrome\BLBeacon') as key:
+                return winreg.QueryValueEx(key, 'version')[0]
+        except OSError:
+            continue
+    return None
+
+
+def major_version(version):
+    """Major component of a version string"""
+    match = VERSION_PATTERN.search(version or '')
+    return match.group(1) if match else None
+
+
+def load_cache():
+    """Return the cached resolution, or an empty dict"""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(entry):
+    """Write the cache atomically so parallel workers never see a partial file"""
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+def resolve_chromedriver():
+    """Return a chromedriver path compatible with the installed Chrome"""
+    # An explicit path always wins
+    override = os.environ.get('CHROMEDRIVER_PATH')
+    if override:
+        return override
+
+    chrome_version = detect_chrome_version()
+    chrome_major = major_version(chrome_version)
+    cached = load_cache()
+    driver_path = cached.get('driver_path')
+
+    if driver_path and os.path.isfile(driver_path):
+        # Without a detectable Chrome we trust the last good resolution
+        if chrome_major is None or cached.get('chrome_major') == chrome_major:
+            logger.info(f"Using cached chromedriver: {driver_path}")
+            return driver_path
+        logger.info(f"Chrome major version changed from {cached.get('chrome_major')} "
+                    f"to {chrome_major}, resolving chromedriver again")
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = ChromeDriverManager().install()
+    save_cache({
+        'driver_path': driver_path,
+        'chrome_version': chrome_version,
+        'chrome_major': chrome_major,
+    })
+    logger.info(f"Resolved chromedriver {driver_path} for Chrome {chrome_version or 'unknown'}")
+    return driver_path
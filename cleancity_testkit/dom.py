@@ -0,0 +1,69 @@
+"""Deferred, compressed page-source capture.
+
+Serializing and transferring the DOM is only worth it when someone will
+read it. Tests mark the points where the DOM is interesting with
+``mark``; nothing is fetched there unless ``CLEANCITY_CAPTURE_DOM=1`` is
+set. When a test fails, ``end_test`` captures the full DOM once, named
+after the last mark, next to the test's screenshots. Files are
+zstd-compressed when the ``zstandard`` package is installed and gzipped
+otherwise.
+"""
+import gzip
+import logging
+import os
+from datetime import datetime
+
+from cleancity_testkit import workers
+
+logger = logging.getLogger(__name__)
+
+DEBUG_ENV_VAR = 'CLEANCITY_CAPTURE_DOM'
+
+_last_mark = None
+
+
+def debug_enabled():
+    return os.environ.get(DEBUG_ENV_VAR, '') not in ('', '0')
+
+
+def compress(text):
+    """Compressed bytes and the file extension for them"""
+    data = text.encode('utf-8')
+    try:
+        import zstandard
+    except ImportError:
+        return gzip.compress(data, compresslevel=6), '.gz'
+    return zstandard.ZstdCompressor(level=10).compress(data), '.zst'
+
+
+def capture(driver, prefix, name):
+    """Write the full DOM to the screenshot directory; returns the path or None"""
+    try:
+        data, extension = compress(driver.page_source)
+    except Exception as e:
+        logger.warning(f"Could not capture page source for {name}: {str(e)}")
+        return None
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = workers.screenshot_path(f"{prefix}_{name}_{timestamp}.html{extension}")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    logger.info(f"Page source saved: {path}")
+    return path
+
+
+def mark(driver, prefix, name):
+    """Note an interesting DOM state; captured now only in debug mode"""
+    global _last_mark
+    _last_mark = name
+    if debug_enabled():
+        return capture(driver, prefix, name)
+    return None
+
+
+def end_test(driver, prefix, failed):
+    """Capture the DOM if the test failed, then forget this test's marks"""
+    global _last_mark
+    path = capture(driver, prefix, f"{_last_mark or 'final'}_on_failure") if failed else None
+    _last_mark = None
+    return path
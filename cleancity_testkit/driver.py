@@ -0,0 +1,69 @@
+"""Process-wide Chrome session shared by every UI test class.
+
+Starting Chrome is the most expensive part of a test run, so the suite
+starts one browser per process (which is also one per xdist worker) and
+resets the app state between tests instead of relaunching.
+"""
+import atexit
+import logging
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from cleancity_testkit import instrumentation, profiles, waits, workers
+from cleancity_testkit.chromedriver_cache import resolve_chromedriver
+
+logger = logging.getLogger(__name__)
+
+# Clears everything the app keeps for its origin
+RESET_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+_driver = None
+_default_window_size = None
+
+
+def get_driver():
+    """Return the shared driver, starting Chrome on first use"""
+    global _driver, _default_window_size
+    if _driver is None:
+        profile = profiles.active_profile()
+        logger.info(f"Starting shared Chrome session with profile '{profile}'...")
+        options = profiles.build_chrome_options(profile)
+        # Parallel workers must never share a Chrome profile (storage, cookies, locks)
+        options.add_argument(f'--user-data-dir={workers.chrome_profile_dir()}')
+        _driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        instrumentation.instrument(_driver)
+        _default_window_size = _driver.get_window_size()
+        waits.install_app_hook(_driver)
+        atexit.register(quit_driver)
+        logger.info("Shared Chrome session started")
+    return _driver
+
+
+def quit_driver():
+    """Quit the shared driver if it is running"""
+    global _driver
+    if _driver is not None:
+        try:
+            _driver.quit()
+            logger.info("Shared Chrome session closed")
+        except Exception as e:
+            logger.warning(f"Error closing shared Chrome session: {str(e)}")
+        _driver = None
+        workers.remove_chrome_profile_dir()
+
+
+def reset_state(driver, base_url):
+    """Clear storage and cookies for the app origin and return to base_url"""
+    # Storage can only be cleared from a page on the app origin
+    if not driver.current_url.startswith(base_url.rstrip('/')):
+        driver.get(base_url)
+    driver.execute_script(RESET_STORAGE_SCRIPT)
+    driver.delete_all_cookies()
+    driver.get(base_url)
+
+
+def restore_window(driver):
+    """Put the window back to the size it had when the session started"""
+    if _default_window_size:
+        driver.set_window_size(_default_window_size['width'], _default_window_size['height'])
@@ -0,0 +1,158 @@
+"""Historical test durations and a longest-first xdist scheduler.
+
+The controller records setup + call + teardown time for every test and
+merges it into ``.cache/durations.json`` at the end of the run (an
+exponentially weighted average, so one slow run does not dominate). Tests
+without history are estimated at the median of the known durations.
+
+Under ``-n`` the ``longest-first`` schedule sorts the collection by
+estimated duration and hands each worker one test at a time, longest
+first, so the long tests start early and the short ones fill the gaps at
+the end. After the run the busy time of each worker is reported with the
+makespan and how far it is from a perfect split.
+"""
+import json
+import logging
+import os
+import statistics
+
+logger = logging.getLogger(__name__)
+
+DURATIONS_FILE = os.environ.get('CLEANCITY_DURATIONS', os.path.join('.cache', 'durations.json'))
+SCHEDULE_ENV_VAR = 'CLEANCITY_SCHEDULE'
+SCHEDULES = ('longest-first', 'xdist')
+DEFAULT_SCHEDULE = 'longest-first'
+
+# Estimate for a new test when nothing at all is known yet
+DEFAULT_ESTIMATE = 30.0
+# Weight of the latest run in the stored average
+SMOOTHING = 0.5
+
+
+def schedule_name():
+    return os.environ.get(SCHEDULE_ENV_VAR, DEFAULT_SCHEDULE)
+
+
+class DurationStore:
+    """Stored per-test durations plus what the current run measured"""
+
+    def __init__(self, path=DURATIONS_FILE):
+        self.path = path
+        self.history = self._load()
+        self.observed = {}
+        self.worker_busy = {}
+        self.worker_tests = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def fallback(self):
+        """Estimate for tests without history"""
+        if not self.history:
+            return DEFAULT_ESTIMATE
+        return statistics.median(self.history.values())
+
+    def estimate(self, nodeid):
+        return self.history.get(nodeid, self.fallback())
+
+    def add(self, report):
+        """Account one setup/call/teardown report to its test and worker"""
+        node = getattr(report, 'node', None)
+        worker = node.gateway.id if node is not None else 'main'
+        self.observed[report.nodeid] = self.observed.get(report.nodeid, 0.0) + report.duration
+        self.worker_busy[worker] = self.worker_busy.get(worker, 0.0) + report.duration
+        if report.when == 'teardown':
+            self.worker_tests[worker] = self.worker_tests.get(worker, 0) + 1
+
+    def save(self):
+        """Merge this run's durations into the stored history"""
+        if not self.observed:
+            return
+        merged = dict(self.history)
+        for nodeid, seconds in self.observed.items():
+            previous = merged.get(nodeid)
+            merged[nodeid] = seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def balance_report(self):
+        """Lines describing how evenly the run's work was spread over workers"""
+        if len(self.worker_busy) < 2:
+            return []
+        makespan = max(self.worker_busy.values())
+        mean = statistics.mean(self.worker_busy.values())
+        lines = [f"{worker}: {seconds:.1f}s busy, {self.worker_tests.get(worker, 0)} tests"
+                 for worker, seconds in sorted(self.worker_busy.items())]
+        lines.append(f"makespan {makespan:.1f}s, mean {mean:.1f}s, "
+                     f"imbalance {makespan / mean - 1 if mean else 0.0:+.0%} over an even split")
+        return lines
+
+
+_store = None
+
+
+def get_store():
+    """Process-wide duration store"""
+    global _store
+    if _store is None:
+        _store = DurationStore()
+    return _store
+
+
+def make_scheduler(config, log):
+    """A LongestFirstScheduling for xdist's ``load`` mode"""
+    from xdist.scheduler import LoadScheduling
+
+    class LongestFirstScheduling(LoadScheduling):
+        """Dispatch tests one at a time per worker, longest estimate first"""
+
+        # A worker only runs a test once it knows the next one, so each
+        # worker holds one running and one queued test
+        queue_depth = 2
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = list(self.node2collection.values())[0]
+            store = get_store()
+            estimates = [store.estimate(nodeid) for nodeid in self.collection]
+            self.pending[:] = sorted(range(len(self.collection)), key=lambda i: -estimates[i])
+            if not self.collection:
+                return
+            unknown = sum(1 for nodeid in self.collection if nodeid not in store.history)
+            self.log(f"longest-first: {len(self.collection)} tests, {unknown} estimated at "
+                     f"{store.fallback():.1f}s, ~{sum(estimates) / len(self.nodes):.1f}s per worker")
+
+            for _ in range(self.queue_depth):
+                for node in self.nodes:
+                    if self.pending:
+                        self._send_tests(node, 1)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration=0):
+            if node.shutting_down:
+                return
+            if self.pending:
+                missing = self.queue_depth - len(self.node2pending[node])
+                if missing > 0:
+                    self._send_tests(node, min(missing, len(self.pending)))
+            else:
+                node.shutdown()
+
+    return LongestFirstScheduling(config, log)
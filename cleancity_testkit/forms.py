@@ -0,0 +1,61 @@
+"""Fill form fields in one browser call in a way React notices.
+
+React 18 tracks the last value it rendered into a controlled input and
+ignores ``input`` events when ``element.value`` was assigned directly, so
+plain ``arguments[0].value = ...`` never reaches component state. Going
+through the native prototype setter bypasses that tracker; the ``input``
+and ``change`` events that follow then update React state and the
+vanilla ``script.js`` listeners alike.
+"""
+import logging
+
+from cleancity_testkit import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Delay between keystrokes in human typing mode
+KEYSTROKE_DELAY = 0.1
+
+FILL_FORM_SCRIPT = """
+var pairs = arguments[0];
+pairs.forEach(function (pair) {
+  var el = pair[0], value = pair[1];
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+    : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : HTMLInputElement.prototype;
+  var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+  el.focus();
+  setter.call(el, value);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  el.blur();
+});
+"""
+
+CLEAR_SCRIPT = """
+var el = arguments[0];
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, '');
+el.dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+
+def fill_form(driver, fields, human_typing=False, delay=KEYSTROKE_DELAY):
+    """Set the value of each element in fields ({element: value}).
+
+    By default all values are set in a single ``execute_script`` call.
+    With ``human_typing=True`` each field is cleared and typed one key at a
+    time with ``delay`` seconds between keys, for tests of keystroke
+    handling.
+    """
+    with instrumentation.phase('input'):
+        if human_typing:
+            for element, value in fields.items():
+                driver.execute_script(CLEAR_SCRIPT, element)
+                for char in str(value):
+                    element.send_keys(char)
+                    instrumentation.sleep(delay)
+            return
+
+        driver.execute_script(FILL_FORM_SCRIPT, [[element, str(value)] for element, value in fields.items()])
+    logger.debug(f"Filled {len(fields)} fields")
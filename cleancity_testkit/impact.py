@@ -0,0 +1,123 @@
+"""Change-impact test selection.
+
+``COVERAGE`` maps each test (``Class::method``, or a whole ``Class``) to
+the app source files it exercises. Given the files changed since a git
+ref, ``select`` keeps the tests whose files changed plus the ``SMOKE``
+tests. A change to a file every page loads (``GLOBAL``), or to an app
+file no test claims, selects the whole suite. Files outside the app and
+the suite, such as docs and the Jest tests, select nothing beyond the
+smoke set.
+"""
+import fnmatch
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+CHANGED_SINCE_ENV_VAR = 'CLEANCITY_CHANGED_SINCE'
+
+AUTH = ['src/components/Login.js', 'src/components/Register.js', 'src/services/authService.js']
+
+COVERAGE = {
+    'TestNavigation::test_navbar_links': ['src/components/LandingPage.js', 'src/components/Awareness.js'],
+    'TestLoginFunctionality::test_valid_login': ['src/components/Login.js', 'src/services/authService.js'],
+    'TestLoginFunctionality::test_invalid_login': ['src/components/Login.js', 'src/services/authService.js'],
+    'TestLoginFunctionality::test_invalid_registration': ['src/components/Register.js', 'src/services/authService.js'],
+    'TestLoginFunctionality::test_logout_functionality': AUTH,
+    'TestUserJourney::test_register': ['src/components/Register.js', 'src/services/authService.js'],
+    'TestUserJourney::test_login': AUTH,
+    'TestUserJourney::test_logout': AUTH,
+    'TestUserJourney::test_admin_login': ['src/components/Login.js', 'src/services/authService.js'],
+    'TestUserJourney::test_edit_profile': AUTH + ['src/components/profile/*'],
+    'TestUserJourney::test_admin_profile': AUTH + ['src/components/profile/*'],
+    'TestUserJourney::test_schedule_pickup': AUTH + ['src/components/Home.*', 'src/services/pickupService.js'],
+    'TestUserJourney::test_community_post': AUTH + ['src/components/community/*'],
+    'TestUserJourney::test_dashboard': AUTH + ['src/components/Dashboard.*', 'src/services/dataService.js'],
+    'TestUserJourney::test_feedback': AUTH + ['src/components/Feedback.*', 'src/services/dataService.js'],
+    'TestUserJourney::test_blog_page': ['src/components/blog/*'],
+    'TestUserJourney::test_awareness_page': ['src/components/Awareness.*'],
+    'TestUserJourney::test_admin_dashboard': AUTH + ['src/components/Admin.*', 'src/components/NotificationBell.*',
+                                                     'src/services/notificationService.js'],
+    'TestSchedulePickup': AUTH + ['src/components/Home.*', 'src/services/pickupService.js',
+                                  'src/services/dataService.js'],
+    'TestDashboard': AUTH + ['src/components/Dashboard.*', 'src/components/NotificationBell.*',
+                             'src/services/dataService.js', 'src/services/notificationService.js'],
+    'TestResponsiveDesign': ['src/*.css', 'src/components/LandingPage.js'],
+}
+
+# Always run: a quick check that the app loads, navigates and logs in
+SMOKE = ['TestNavigation::test_navbar_links', 'TestLoginFunctionality::test_valid_login']
+
+# Loaded by every page, or part of the suite itself
+GLOBAL = [
+    'index.html', 'script.js', 'styles.css', 'public/*', 'src/App.*', 'src/index.*',
+    'package.json', 'package-lock.json', 'requirements.txt',
+    'conftest.py', 'test_cleancity_ui.py', 'cleancity_testkit/*',
+]
+
+# App files; a changed one that no test claims selects everything
+APP = ['src/*']
+
+# Never affect the UI suite
+IGNORED = ['src/__tests__/*', 'src/setupTests.js']
+
+
+def _matches(path, patterns):
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+def changed_files(ref, cwd=None):
+    """Files changed between the merge base with ref and the working tree"""
+    base = subprocess.run(['git', 'merge-base', ref, 'HEAD'], cwd=cwd, capture_output=True,
+                          text=True, check=True).stdout.strip()
+    diff = subprocess.run(['git', 'diff', '--name-only', base], cwd=cwd, capture_output=True,
+                          text=True, check=True).stdout
+    return [line for line in diff.splitlines() if line]
+
+
+def covered_files(nodeid):
+    """Source patterns declared for a test nodeid such as 'file.py::Class::method'"""
+    parts = nodeid.split('::')
+    patterns = []
+    for key in ('::'.join(parts[1:3]), parts[1] if len(parts) > 1 else ''):
+        patterns.extend(COVERAGE.get(key, []))
+    return patterns
+
+
+def select(nodeids, changed):
+    """(selected nodeids, {nodeid: reason}) for the given changed files"""
+    relevant = [path for path in changed if not _matches(path, IGNORED)]
+    global_changes = [path for path in relevant if _matches(path, GLOBAL)]
+    if global_changes:
+        return list(nodeids), {nodeid: f"global change {global_changes[0]}" for nodeid in nodeids}
+
+    claimed = set()
+    reasons = {}
+    for nodeid in nodeids:
+        hits = [path for path in relevant if _matches(path, covered_files(nodeid))]
+        claimed.update(hits)
+        if hits:
+            reasons[nodeid] = f"covers {', '.join(hits)}"
+        elif '::'.join(nodeid.split('::')[1:3]) in SMOKE:
+            reasons[nodeid] = 'smoke'
+
+    unclaimed = [path for path in relevant if _matches(path, APP) and path not in claimed]
+    if unclaimed:
+        return list(nodeids), {nodeid: f"unmapped change {unclaimed[0]}" for nodeid in nodeids}
+    return [nodeid for nodeid in nodeids if nodeid in reasons], reasons
+
+
+def filter_items(items, ref, cwd=None):
+    """(kept items, deselected items, report lines) for the changes since ref"""
+    try:
+        changed = changed_files(ref, cwd=cwd)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Could not diff against {ref}, running every test: {str(e)}")
+        return items, [], [f"change impact: git diff against {ref} failed, running all {len(items)} tests"]
+    selected, reasons = select([item.nodeid for item in items], changed)
+    selected = set(selected)
+    kept = [item for item in items if item.nodeid in selected]
+    deselected = [item for item in items if item.nodeid not in selected]
+    lines = [f"change impact: {len(changed)} files changed since {ref}, running {len(kept)} of {len(items)} tests"]
+    lines.extend(f"  {item.nodeid}: {reasons[item.nodeid]}" for item in kept)
+    return kept, deselected, lines
@@ -0,0 +1,233 @@
+"""Where a test's time goes: WebDriver commands, waits and sleeps.
+
+``instrument(driver)`` wraps the driver's ``execute`` so every WebDriver
+command (element commands included) is recorded with its name, duration
+and outcome. Waits and sleeps record the time requested next to the time
+actually spent. Each record belongs to a category: the enclosing
+``phase(...)`` if there is one (``lookups`` around a locator chain,
+``screenshots`` around a capture, ...), otherwise one derived from the
+command name.
+
+At exit the recorder writes a per-test breakdown to
+``test-reports/timings.json`` and a Chrome trace-event file to
+``test-reports/trace.json`` (worker-tagged under xdist) that can be
+opened offline in ``chrome://tracing`` or Perfetto. Recording is enabled
+with ``--instrument`` or ``CLEANCITY_INSTRUMENT=1``.
+"""
+import atexit
+import contextlib
+import json
+import logging
+import os
+import time
+
+from cleancity_testkit import workers
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENT_ENV_VAR = 'CLEANCITY_INSTRUMENT'
+REPORT_DIR = 'test-reports'
+
+COMMAND_CATEGORIES = {
+    'get': 'navigation', 'goBack': 'navigation', 'goForward': 'navigation', 'refresh': 'navigation',
+    'getCurrentUrl': 'navigation', 'getTitle': 'navigation', 'getPageSource': 'navigation',
+    'newWindow': 'navigation', 'switchToWindow': 'navigation', 'close': 'navigation',
+    'getCurrentWindowHandle': 'navigation',
+    'findElement': 'lookups', 'findElements': 'lookups',
+    'findChildElement': 'lookups', 'findChildElements': 'lookups',
+    'isElementDisplayed': 'lookups', 'getElementText': 'lookups', 'getElementAttribute': 'lookups',
+    'getElementProperty': 'lookups', 'getElementTagName': 'lookups', 'isElementEnabled': 'lookups',
+    'isElementSelected': 'lookups', 'getElementRect': 'lookups',
+    'clickElement': 'input', 'sendKeysToElement': 'input', 'clearElement': 'input', 'actions': 'input',
+    'executeScript': 'script', 'executeAsyncScript': 'script',
+    'screenshot': 'screenshots', 'elementScreenshot': 'screenshots',
+    'setWindowRect': 'setup', 'getWindowRect': 'setup', 'deleteAllCookies': 'setup',
+    'setTimeouts': 'setup', 'executeCdpCommand': 'setup', 'getLog': 'setup',
+}
+
+
+def enabled():
+    return os.environ.get(INSTRUMENT_ENV_VAR, '') not in ('', '0')
+
+
+class Recorder:
+    """Timed events for the whole process, grouped by test"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.phases = []
+        # Open wait spans; commands polled inside one are part of its time
+        self.depth = 0
+        self.test_id = None
+        self.test_start = None
+
+    def record(self, name, category, start, duration, ok=True, **args):
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'start': start - self.origin,
+            'dur': duration,
+            'ok': ok,
+            'test': self.test_id,
+            'nested': self.depth > 0,
+            'args': args,
+        })
+
+    def begin_test(self, test_id):
+        self.test_id = test_id
+        self.test_start = time.perf_counter()
+
+    def end_test(self):
+        if self.test_id is None:
+            return
+        self.record(self.test_id, 'test', self.test_start, time.perf_counter() - self.test_start)
+        breakdown = self.breakdown(self.test_id)
+        logger.debug(f"Time breakdown for {self.test_id}: {json.dumps(breakdown['categories'])}")
+        self.test_id = None
+
+    def breakdown(self, test_id):
+        """Seconds and counts per category for one test"""
+        events = [e for e in self.events if e['test'] == test_id]
+        total = next((e['dur'] for e in events if e['cat'] == 'test'), 0.0)
+        categories = {}
+        for event in events:
+            if event['cat'] == 'test' or event['nested']:
+                continue
+            bucket = categories.setdefault(event['cat'], {'count': 0, 'seconds': 0.0, 'failed': 0})
+            bucket['count'] += 1
+            bucket['seconds'] += event['dur']
+            bucket['failed'] += 0 if event['ok'] else 1
+        result = {'total_seconds': total, 'categories': categories}
+        # Upper bounds asked for versus time actually spent
+        for category in ('waits', 'sleeps'):
+            timed = [e for e in events if e['cat'] == category and 'requested' in e['args']]
+            result[category] = {
+                'requested_seconds': sum(e['args']['requested'] for e in timed),
+                'actual_seconds': sum(e['dur'] for e in timed),
+            }
+        return result
+
+    def trace_events(self):
+        """Events in Chrome trace-event format (microseconds)"""
+        pid = os.getpid()
+        return [{
+            'name': event['name'],
+            'cat': event['cat'],
+            'ph': 'X',
+            'ts': event['start'] * 1e6,
+            'dur': event['dur'] * 1e6,
+            'pid': pid,
+            # Tests on one track, their commands on the next
+            'tid': 0 if event['cat'] == 'test' else 1,
+            'args': dict(event['args'], ok=event['ok'], test=event['test']),
+        } for event in self.events]
+
+    def write(self, report_dir=REPORT_DIR):
+        os.makedirs(report_dir, exist_ok=True)
+        tests = sorted({e['test'] for e in self.events if e['test']})
+        timings_path = os.path.join(report_dir, workers.worker_path('timings.json'))
+        with open(timings_path, 'w') as f:
+            json.dump({test_id: self.breakdown(test_id) for test_id in tests}, f, indent=2)
+        trace_path = os.path.join(report_dir, workers.worker_path('trace.json'))
+        with open(trace_path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+        logger.info(f"Timing breakdown written to {timings_path}, trace to {trace_path}")
+
+
+_recorder = None
+
+
+def get_recorder():
+    """Process-wide recorder, or None when instrumentation is off"""
+    global _recorder
+    if _recorder is None and enabled():
+        _recorder = Recorder()
+        atexit.register(_finish)
+    return _recorder
+
+
+def instrument(driver):
+    """Record every command the driver executes; returns the driver"""
+    recorder = get_recorder()
+    if recorder is None:
+        return driver
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        ok = True
+        try:
+            return execute(driver_command, params)
+        except Exception:
+            ok = False
+            raise
+        finally:
+            category = recorder.phases[-1] if recorder.phases else COMMAND_CATEGORIES.get(driver_command, 'other')
+            recorder.record(driver_command, category, start, time.perf_counter() - start, ok)
+
+    driver.execute = timed_execute
+    return driver
+
+
+@contextlib.contextmanager
+def phase(category):
+    """Attribute commands issued inside the block to category"""
+    recorder = get_recorder()
+    if recorder is None:
+        yield
+        return
+    recorder.phases.append(category)
+    try:
+        yield
+    finally:
+        recorder.phases.pop()
+
+
+@contextlib.contextmanager
+def timed_wait(name, requested):
+    """Record a wait with its requested upper bound and the time it took"""
+    recorder = get_recorder()
+    if recorder is None:
+        yield
+        return
+    start = time.perf_counter()
+    ok = True
+    recorder.phases.append('waits')
+    recorder.depth += 1
+    try:
+        yield
+    except Exception:
+        ok = False
+        raise
+    finally:
+        recorder.phases.pop()
+        recorder.depth -= 1
+        recorder.record(name, 'waits', start, time.perf_counter() - start, ok, requested=requested)
+
+
+def sleep(seconds):
+    """time.sleep that is recorded with requested and actual duration"""
+    start = time.perf_counter()
+    time.sleep(seconds)
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.record('sleep', 'sleeps', start, time.perf_counter() - start, requested=seconds)
+
+
+def begin_test(test_id):
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.begin_test(test_id)
+
+
+def end_test():
+    recorder = get_recorder()
+    if recorder is not None:
+        recorder.end_test()
+
+
+def _finish():
+    if _recorder is not None and _recorder.events:
+        _recorder.end_test()
+        _recorder.write()
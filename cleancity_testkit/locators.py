@@ -0,0 +1,176 @@
+"""Persistent cache of the winning candidate in selector fallback chains.
+
+Many steps try a list of candidate locators for one logical element (for
+example ``login.email``) and a miss can cost a full wait timeout. The cache
+remembers which candidate matched, keyed by app build and page, and tries
+it first next time. An entry that stops matching is demoted in favour of
+the candidate that matches now. Hit rate and estimated time saved are
+reported at the end of the run.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cleancity_testkit import budget, instrumentation, probe, server
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.environ.get('CLEANCITY_LOCATOR_CACHE', os.path.join('.cache', 'locators.json'))
+
+# Deployed bundles are content-hashed, so their URLs identify other builds
+BUILD_ID_SCRIPT = """
+return Array.prototype.map.call(document.scripts, function (s) {
+  return s.src ? new URL(s.src).pathname : String(s.textContent.length);
+}).join('|');
+"""
+
+POLL_FREQUENCY = 0.1
+
+
+def probe_until(driver, candidates, visible=False, timeout=0):
+    """Poll all candidates together until one matches.
+
+    Returns ``(element, index)``, or ``(None, None)`` once ``timeout``
+    seconds have passed; 0 probes once.
+    """
+    def condition(d):
+        element, index = probe.probe_first(d, candidates, visible)
+        return (element, index) if element is not None else False
+
+    try:
+        if timeout <= 0:
+            return condition(driver) or (None, None)
+        with instrumentation.timed_wait('probe_until', timeout):
+            return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+    except (TimeoutException, StaleElementReferenceException):
+        return None, None
+
+
+class LocatorCache:
+    """Winning locators per app build, page and logical element name"""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.entries = self._load()
+        self.build_ids = {}
+        self.dirty_keys = set()
+        self.stats = {'hits': 0, 'misses': 0, 'demotions': 0, 'time_saved': 0.0}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def build_id(self, driver):
+        """Short hash identifying the app build, computed once per origin
+
+        The app under test is hashed by content (see ``server.build_id``):
+        the local app always loads ``/script.js``, so its script URLs never
+        change. Any other origin falls back to its script bundle URLs.
+        """
+        parsed = urlparse(driver.current_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self.build_ids:
+            if origin == server.app_origin():
+                self.build_ids[origin] = server.build_id()
+            else:
+                scripts = driver.execute_script(BUILD_ID_SCRIPT) or ''
+                self.build_ids[origin] = hashlib.sha1(scripts.encode()).hexdigest()[:12]
+        return self.build_ids[origin]
+
+    def key(self, driver, name):
+        page = urlparse(driver.current_url).path or '/'
+        return f"{self.build_id(driver)}|{page}|{name}"
+
+    def resolve(self, driver, name, candidates, visible=False, timeout=0):
+        """Return the element for the first matching candidate, or None.
+
+        The cached winner is probed first and the rest of the chain in the
+        same browser call. ``timeout`` bounds the whole lookup; 0 checks once.
+        """
+        key = self.key(driver, name)
+        entry = self.entries.get(key)
+        candidates = [tuple(c) for c in candidates]
+        cached = (entry['by'], entry['value']) if entry else None
+        if cached in candidates:
+            candidates = [cached] + [c for c in candidates if c != cached]
+        elif entry:
+            # Saved for a different chain under the same name; never try a locator the caller did not offer
+            logger.debug(f"Cached locator for {name} is not one of its candidates, ignoring it")
+            entry = None
+
+        start = time.monotonic()
+        with instrumentation.phase('lookups'):
+            element, index = probe_until(driver, candidates, visible, budget.timeout(timeout))
+        elapsed = time.monotonic() - start
+        if element is None:
+            self.stats['misses'] += 1
+            budget.record_failure(name, elapsed)
+            logger.debug(f"{name} not found with any of {len(candidates)} candidates")
+            return None
+
+        by, value = candidates[index]
+        if entry and index == 0:
+            self.stats['hits'] += 1
+            self.stats['time_saved'] += max(0.0, entry.get('chain_cost', 0.0) - elapsed)
+            logger.info(f"Found {name} with cached {by}={value}")
+            return element
+
+        self.stats['misses'] += 1
+        if entry:
+            logger.info(f"Cached locator for {name} no longer matches, demoting it")
+            self.stats['demotions'] += 1
+        logger.info(f"Found {name} with {by}={value}")
+        self.entries[key] = {'by': by, 'value': value, 'chain_cost': elapsed}
+        self.dirty_keys.add(key)
+        return element
+
+    def report(self):
+        """One-line summary of cache effectiveness"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = self.stats['hits'] / lookups * 100 if lookups else 0.0
+        return (f"Locator cache: {self.stats['hits']}/{lookups} hits ({hit_rate:.0f}%), "
+                f"{self.stats['demotions']} demoted, ~{self.stats['time_saved']:.1f}s saved")
+
+    def save(self):
+        """Merge this process's changes into the cache file"""
+        if not self.dirty_keys:
+            return
+        # Other xdist workers may have written since we loaded
+        merged = self._load()
+        for key in self.dirty_keys:
+            merged[key] = self.entries[key]
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+_cache = None
+
+
+def get_cache():
+    """Process-wide locator cache, saved and reported at exit"""
+    global _cache
+    if _cache is None:
+        _cache = LocatorCache()
+        atexit.register(_finish)
+    return _cache
+
+
+def _finish():
+    if _cache is None:
+        return
+    if _cache.stats['hits'] or _cache.stats['misses']:
+        logger.info(_cache.report())
+    _cache.save()
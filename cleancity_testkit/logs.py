@@ -0,0 +1,190 @@
+"""Structured, asynchronous logging for the UI suite.
+
+Loggers only put records on a queue (``QueueHandler``); a
+``QueueListener`` thread formats them and does the file and console I/O.
+The log file holds one JSON object per line with the test id, worker id,
+current step and milliseconds since the test started. A step starts at a
+``set_step`` call or at any message of the form ``=== STEP NAME ===``,
+which is how the tests already mark their phases.
+
+Messages longer than ``PAYLOAD_THRESHOLD`` characters (page source dumps,
+for example) are written to a side file instead. The JSON line then keeps
+the first line of the message and a ``payload`` path.
+
+Records below WARNING that belong to a test are held in memory until the
+test ends and reach the file only if it failed; a passing test leaves a
+single summary line. Set ``CLEANCITY_LOG_BUFFER=0`` to write everything.
+"""
+import atexit
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import shutil
+import time
+
+from cleancity_testkit import workers
+
+PAYLOAD_THRESHOLD = int(os.environ.get('CLEANCITY_LOG_PAYLOAD_THRESHOLD', '500'))
+CONSOLE_FORMAT = '%(asctime)s - %(worker_id)s - %(name)s - %(levelname)s - %(message)s'
+
+BUFFER_ENV_VAR = 'CLEANCITY_LOG_BUFFER'
+
+STEP_PATTERN = re.compile(r'^\s*=== (.+?) ===\s*$')
+
+# Context of the running test, stamped onto every record on the calling thread
+_context = {'test_id': None, 'step': None, 'start': time.monotonic()}
+_listener = None
+_queue_handler = None
+_buffer_handler = None
+
+
+def begin_test(test_id):
+    _context.update(test_id=test_id, step=None, start=time.monotonic())
+
+
+def end_test(failed=False):
+    """Close the test's log buffer, writing it out only if the test failed"""
+    if _queue_handler is not None and _context['test_id']:
+        # Travels through the queue behind the test's own records
+        marker = logging.makeLogRecord({
+            'name': __name__, 'levelno': logging.INFO, 'levelname': 'INFO',
+            'msg': '', 'test_end': True, 'failed': failed,
+        })
+        _queue_handler.handle(marker)
+    _context.update(test_id=None, step=None)
+
+
+def set_step(step):
+    """Name the step that following records belong to"""
+    _context['step'] = step
+
+
+class ContextFilter(logging.Filter):
+    """Adds test_id, worker_id, step and elapsed_ms to each record"""
+
+    def filter(self, record):
+        match = STEP_PATTERN.match(str(record.msg))
+        if match:
+            _context['step'] = match.group(1)
+        record.test_id = _context['test_id']
+        record.worker_id = workers.worker_id()
+        record.step = _context['step']
+        record.elapsed_ms = round((time.monotonic() - _context['start']) * 1000, 1)
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human-readable lines; large payloads are cut to their first line"""
+
+    def formatMessage(self, record):
+        if len(record.message) > PAYLOAD_THRESHOLD:
+            first_line = record.message.strip().split('\n', 1)[0][:200]
+            record = logging.makeLogRecord(dict(record.__dict__, message=f"{first_line} [{len(record.message)} chars in log payload]"))
+        return super().formatMessage(record)
+
+
+class JsonLinesHandler(logging.FileHandler):
+    """Writes records as JSON lines, moving large messages to side files"""
+
+    def __init__(self, filename, payload_dir):
+        super().__init__(filename, mode='w', encoding='utf-8')
+        self.payload_dir = payload_dir
+        self.payload_ids = itertools.count(1)
+        # Payloads from the previous run belong to a log file that no longer exists
+        shutil.rmtree(payload_dir, ignore_errors=True)
+
+    def format(self, record):
+        message = record.getMessage()
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'test_id': getattr(record, 'test_id', None),
+            'worker_id': getattr(record, 'worker_id', None),
+            'step': getattr(record, 'step', None),
+            'elapsed_ms': getattr(record, 'elapsed_ms', None),
+            'msg': message,
+        }
+        if len(message) > PAYLOAD_THRESHOLD:
+            entry['msg'] = message.strip().split('\n', 1)[0][:200]
+            entry['payload'] = self.write_payload(message)
+        return json.dumps(entry, ensure_ascii=False)
+
+    def write_payload(self, message):
+        os.makedirs(self.payload_dir, exist_ok=True)
+        path = os.path.join(self.payload_dir, f"{next(self.payload_ids):06d}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(message)
+        return path
+
+
+class TestBufferHandler(logging.Handler):
+    """Holds each test's records below WARNING until the test ends"""
+
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+        self.buffers = {}
+
+    def emit(self, record):
+        test_id = getattr(record, 'test_id', None)
+        if getattr(record, 'test_end', False):
+            records = self.buffers.pop(test_id, [])
+            if record.failed:
+                for buffered in records:
+                    self.target.handle(buffered)
+            outcome = 'FAILED' if record.failed else 'PASSED'
+            action = 'written' if record.failed else 'dropped'
+            record.msg = f"{outcome} {test_id} in {record.elapsed_ms:.0f} ms ({len(records)} buffered records {action})"
+            record.levelno, record.levelname = (logging.ERROR, 'ERROR') if record.failed else (logging.INFO, 'INFO')
+            self.target.handle(record)
+        elif test_id and record.levelno < logging.WARNING:
+            self.buffers.setdefault(test_id, []).append(record)
+        else:
+            self.target.handle(record)
+
+    def flush_pending(self):
+        """Write buffers of tests that never finished (e.g. the run was interrupted)"""
+        for records in self.buffers.values():
+            for record in records:
+                self.target.handle(record)
+        self.buffers.clear()
+
+
+def setup_logging(log_file, loggers, level=logging.INFO):
+    """Route loggers through a queue to a JSON-lines file and the console"""
+    global _listener, _queue_handler, _buffer_handler
+    if _listener is not None:
+        return
+    root, _ = os.path.splitext(log_file)
+    file_handler = JsonLinesHandler(log_file, f"{root}_payloads")
+    if os.environ.get(BUFFER_ENV_VAR, '1') != '0':
+        _buffer_handler = file_handler = TestBufferHandler(file_handler)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(ConsoleFormatter(CONSOLE_FORMAT))
+    console_handler.addFilter(lambda record: not getattr(record, 'test_end', False))
+
+    log_queue = queue.Queue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.addFilter(ContextFilter())
+    for logger in loggers:
+        logger.setLevel(level)
+        logger.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Write out queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        if _buffer_handler is not None:
+            _buffer_handler.flush_pending()
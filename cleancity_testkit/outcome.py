@@ -0,0 +1,31 @@
+"""Whether the running unittest test has failed, asked from its tearDown.
+
+``self._outcome.success`` cannot answer this: from Python 3.11 failures
+go straight to the result object and ``success`` is still True when
+tearDown runs. The result object can, whichever runner passed it in:
+
+- ``unittest.TestResult`` lists the test in ``errors`` or ``failures``;
+- pytest hands in its ``TestCaseFunction``, which keeps the exceptions
+  of the current test in ``_excinfo``, skips and expected failures
+  included.
+
+Before 3.11 the errors are still collected on the outcome itself.
+"""
+
+# pytest's exceptions for skipTest and expectedFailure, which are not failures
+NOT_FAILED = ('Skipped', 'XFailed')
+
+
+def failed(test):
+    """True if test has raised an error or failed an assertion so far"""
+    outcome = getattr(test, '_outcome', None)
+    if outcome is None:
+        return False
+    # Python < 3.11 reports errors to the result only after tearDown
+    if any(exc_info is not None for _, exc_info in getattr(outcome, 'errors', [])):
+        return True
+    result = outcome.result
+    if any(type(excinfo.value).__name__ not in NOT_FAILED for excinfo in getattr(result, '_excinfo', None) or []):
+        return True
+    return any(failed_test is test
+               for failed_test, _ in getattr(result, 'errors', []) + getattr(result, 'failures', []))
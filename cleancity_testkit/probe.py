@@ -0,0 +1,94 @@
+"""Evaluate many candidate locators in a single browser round trip.
+
+Trying fallback selectors one ``find_element`` at a time costs a WebDriver
+HTTP call per candidate (plus an ``is_displayed`` call per match). The
+probe sends every candidate, grouped by logical element, in one
+``execute_script`` call and lets the browser evaluate them together.
+Locators use the usual ``(By.X, value)`` tuples; ``By`` values are plain
+strings such as ``'css selector'`` and ``'xpath'``.
+"""
+
+PROBE_SCRIPT = """
+var groups = arguments[0], visibleOnly = arguments[1];
+
+function query(by, value) {
+  switch (by) {
+    case 'css selector': return Array.from(document.querySelectorAll(value));
+    case 'tag name': return Array.from(document.getElementsByTagName(value));
+    case 'id': return Array.from(document.querySelectorAll('#' + CSS.escape(value)));
+    case 'name': return Array.from(document.getElementsByName(value));
+    case 'class name': return Array.from(document.getElementsByClassName(value));
+    case 'link text':
+      return Array.from(document.getElementsByTagName('a')).filter(function (a) {
+        return a.innerText.trim() === value;
+      });
+    case 'partial link text':
+      return Array.from(document.getElementsByTagName('a')).filter(function (a) {
+        return a.innerText.indexOf(value) !== -1;
+      });
+    case 'xpath':
+      var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+      return nodes.filter(function (n) { return n instanceof Element; });
+  }
+  throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isVisible(el) {
+  var style = window.getComputedStyle(el);
+  if (style.display === 'none' || style.visibility === 'hidden' || Number(style.opacity) === 0) {
+    return false;
+  }
+  return el.getClientRects().length > 0;
+}
+
+return groups.map(function (candidates) {
+  var result = {index: null, element: null, counts: []};
+  candidates.forEach(function (locator, i) {
+    var matches, visible;
+    try {
+      matches = query(locator[0], locator[1]);
+    } catch (e) {
+      result.counts.push({count: 0, visible: 0, error: String(e)});
+      return;
+    }
+    visible = matches.filter(isVisible);
+    result.counts.push({count: matches.length, visible: visible.length});
+    var usable = visibleOnly ? visible : matches;
+    if (result.index === null && usable.length) {
+      result.index = i;
+      result.element = usable[0];
+    }
+  });
+  return result;
+});
+"""
+
+
+def _as_lists(candidates):
+    return [[by, value] for by, value in candidates]
+
+
+def probe_groups(driver, groups, visible=True):
+    """Probe several logical elements at once.
+
+    ``groups`` maps a name to its candidate locators. Returns a dict of
+    name -> ``{'index', 'element', 'counts'}`` where ``index`` is the first
+    candidate with a (visible) match, or None.
+    """
+    names = list(groups)
+    results = driver.execute_script(PROBE_SCRIPT, [_as_lists(groups[name]) for name in names], visible)
+    return dict(zip(names, results))
+
+
+def probe_first(driver, candidates, visible=True):
+    """First matching element and its candidate index, or (None, None)"""
+    result = probe_groups(driver, {'probe': candidates}, visible)['probe']
+    return result['element'], result['index']
+
+
+def probe_map(driver, candidates):
+    """Match and visibility counts for every candidate"""
+    result = probe_groups(driver, {'probe': candidates}, visible=False)['probe']
+    return [dict(counts, locator=tuple(candidate)) for candidate, counts in zip(candidates, result['counts'])]
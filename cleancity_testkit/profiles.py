@@ -0,0 +1,78 @@
+"""Named Chrome run profiles.
+
+``debug-visible`` keeps the original maximized, visible browser for local
+debugging. ``ci-fast`` runs headless and switches off browser features the
+tests never look at. The profile is chosen with ``--profile`` on the pytest
+command line or the ``CLEANCITY_PROFILE`` environment variable.
+"""
+import os
+
+from selenium import webdriver
+
+from cleancity_testkit import resources
+
+PROFILE_ENV_VAR = 'CLEANCITY_PROFILE'
+DEFAULT_PROFILE = 'debug-visible'
+
+# Arguments every profile needs
+COMMON_ARGUMENTS = [
+    '--disable-notifications',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    # Disable automation flags
+    '--disable-blink-features=AutomationControlled',
+    # Viewport tabs load in the background and must not be throttled
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+]
+
+PROFILES = {
+    'debug-visible': {
+        'description': 'Visible, maximized browser for watching a run',
+        'arguments': ['--start-maximized'],
+        'page_load_strategy': 'normal',
+    },
+    'ci-fast': {
+        'description': 'Headless browser with non-essential features disabled',
+        'arguments': [
+            '--headless=new',
+            # Headless windows cannot be maximized, so give them a desktop size
+            '--window-size=1366,900',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-sync',
+            '--no-first-run',
+            '--disable-smooth-scrolling',
+            '--mute-audio',
+            # Images are blocked per class by resource policies, not here, so
+            # responsive and visual tests still see them
+        ],
+        'page_load_strategy': 'eager',
+    },
+}
+
+
+def active_profile():
+    """Name of the profile selected for this run"""
+    name = os.environ.get(PROFILE_ENV_VAR, DEFAULT_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Unknown run profile '{name}'. Choose from: {', '.join(PROFILES)}")
+    return name
+
+
+def build_chrome_options(name=None):
+    """Chrome options for the given profile (defaults to the active one)"""
+    profile = PROFILES[name or active_profile()]
+    options = webdriver.ChromeOptions()
+    for argument in COMMON_ARGUMENTS + profile['arguments']:
+        options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.page_load_strategy = profile['page_load_strategy']
+    if resources.reporting_enabled():
+        resources.enable_performance_log(options)
+    return options
@@ -0,0 +1,151 @@
+"""Per-class resource policies that block non-essential downloads.
+
+A policy is a list of URL patterns handed to CDP ``Network.setBlockedURLs``
+for the current tab. Functional tests opt into ``functional``, which blocks
+images and web fonts; visual and responsive tests keep ``full`` loading.
+
+Blocked requests are counted from Chrome's performance log
+(``Network.loadingFailed`` with a ``blockedReason``). Bytes saved are
+estimated from the sizes the same URLs had when they were last loaded
+under ``full``, which are remembered across runs. The performance log
+costs chromedriver work on every request, so it is only switched on when
+the report is asked for (``--resource-report`` or
+``CLEANCITY_RESOURCE_REPORT=1``) or the run is instrumented; blocking
+applies either way.
+"""
+import atexit
+import json
+import logging
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from cleancity_testkit import instrumentation
+
+logger = logging.getLogger(__name__)
+
+REPORT_ENV_VAR = 'CLEANCITY_RESOURCE_REPORT'
+SIZES_FILE = os.environ.get('CLEANCITY_RESOURCE_SIZES', os.path.join('.cache', 'resource_sizes.json'))
+
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*images.unsplash.com*']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*fonts.googleapis.com*', '*fonts.gstatic.com*']
+
+POLICIES = {
+    'full': [],
+    'functional': IMAGE_PATTERNS + FONT_PATTERNS,
+}
+
+
+def reporting_enabled():
+    """Whether blocked requests are counted this run"""
+    return os.environ.get(REPORT_ENV_VAR, '') not in ('', '0') or instrumentation.enabled()
+
+
+def enable_performance_log(options):
+    """Ask chromedriver to record network events so blocked requests can be counted"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+
+class ResourceTracker:
+    """Active policy per tab plus counts of what it blocked"""
+
+    def __init__(self, sizes_file=SIZES_FILE):
+        self.sizes_file = sizes_file
+        self.sizes = self._load()
+        self.policy = 'full'
+        self.requests = {}
+        self.stats = {}
+
+    def _load(self):
+        try:
+            with open(self.sizes_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def apply(self, driver, policy):
+        """Block the policy's URL patterns in the current tab"""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown resource policy '{policy}'. Choose from: {', '.join(POLICIES)}")
+        # Attribute events seen so far to the policy that produced them
+        self.collect(driver)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': POLICIES[policy]})
+            self.policy = policy
+            logger.info(f"Resource policy '{policy}' active")
+        except WebDriverException as e:
+            logger.warning(f"Could not apply resource policy '{policy}': {str(e)}")
+
+    def collect(self, driver):
+        """Drain the performance log and count blocked requests
+
+        Called after every test; requests still in flight are forgotten so
+        the URL map never outgrows one test.
+        """
+        if not reporting_enabled():
+            return
+        try:
+            entries = driver.get_log('performance')
+        except (WebDriverException, ValueError):
+            return
+        stats = self.stats.setdefault(self.policy, {'requests': 0, 'bytes': 0, 'unknown_size': 0})
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                self.requests[params['requestId']] = params['request']['url']
+            elif method == 'Network.loadingFinished':
+                url = self.requests.pop(params['requestId'], None)
+                if url and self.policy == 'full':
+                    self.sizes[url] = params.get('encodedDataLength', 0)
+            elif method == 'Network.loadingFailed':
+                url = self.requests.pop(params['requestId'], None)
+                if url and params.get('blockedReason'):
+                    stats['requests'] += 1
+                    if url in self.sizes:
+                        stats['bytes'] += self.sizes[url]
+                    else:
+                        stats['unknown_size'] += 1
+        self.requests.clear()
+
+    def report(self):
+        """One line per blocking policy with requests and bytes saved"""
+        lines = []
+        for policy, stats in self.stats.items():
+            if not POLICIES[policy]:
+                continue
+            lines.append(f"Resource policy '{policy}': {stats['requests']} requests blocked, "
+                         f"~{stats['bytes'] / 1e6:.2f} MB saved "
+                         f"({stats['unknown_size']} of unknown size)")
+        return lines
+
+    def save(self):
+        """Remember resource sizes for estimating savings in later runs"""
+        os.makedirs(os.path.dirname(self.sizes_file) or '.', exist_ok=True)
+        tmp_path = f"{self.sizes_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.sizes, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.sizes_file)
+
+
+_tracker = None
+
+
+def get_tracker():
+    """Process-wide tracker, reported and saved at exit"""
+    global _tracker
+    if _tracker is None:
+        _tracker = ResourceTracker()
+        atexit.register(_finish)
+    return _tracker
+
+
+def _finish():
+    if _tracker is None:
+        return
+    for line in _tracker.report():
+        logger.info(line)
+    if _tracker.sizes:
+        _tracker.save()
@@ -0,0 +1,176 @@
+"""Content-addressed, deduplicated screenshot store.
+
+Identical captures (the same login form on every run, say) are stored
+once under the SHA-256 of their bytes in ``screenshots/store/objects``.
+Every capture adds one line to a JSONL manifest recording the object it
+maps to, the test, the step and when it was taken. Each xdist worker
+appends to its own manifest file.
+
+With ``CLEANCITY_SCREENSHOT_PHASH_DISTANCE`` set to a positive number and
+Pillow installed, captures whose 64-bit difference hash is within that
+many bits of an already stored image are also collapsed onto that image;
+their manifest line keeps the stored image in ``sha`` and their own hash
+in ``captured_sha``.
+
+Summarise a store with ``python -m cleancity_testkit.screenshot_store``.
+"""
+import glob
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from cleancity_testkit import workers
+
+logger = logging.getLogger(__name__)
+
+STORE_ENV_VAR = 'CLEANCITY_SCREENSHOT_STORE'
+STORE_DIR = os.path.join(workers.SCREENSHOT_DIR, 'store')
+PHASH_DISTANCE = int(os.environ.get('CLEANCITY_SCREENSHOT_PHASH_DISTANCE', '0'))
+
+
+def enabled():
+    """Whether screenshots go to the store instead of individual files"""
+    return os.environ.get(STORE_ENV_VAR, '') not in ('', '0')
+
+
+def _has_pillow():
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def difference_hash(data):
+    """64-bit perceptual difference hash of a PNG as a hex string, or None without Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    image = Image.open(io.BytesIO(data)).convert('L').resize((9, 8))
+    pixels = list(image.getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left, right = pixels[row * 9 + col], pixels[row * 9 + col + 1]
+            bits = (bits << 1) | (left > right)
+    return f"{bits:016x}"
+
+
+def hamming(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+class ScreenshotStore:
+    """Objects keyed by content hash plus a manifest of every capture"""
+
+    def __init__(self, root=STORE_DIR, phash_distance=PHASH_DISTANCE):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.manifest_path = os.path.join(root, workers.worker_path('manifest.jsonl'))
+        self.phash_distance = phash_distance
+        # {perceptual hash: object sha} for near-duplicate lookups
+        self.phashes = {}
+        self._lock = threading.Lock()
+        if phash_distance and not _has_pillow():
+            logger.warning("Pillow is not installed; only byte-identical screenshots are deduplicated")
+            self.phash_distance = 0
+        if self.phash_distance:
+            for entry in read_manifest(root):
+                if entry.get('phash'):
+                    self.phashes.setdefault(entry['phash'], entry['sha'])
+
+    def object_path(self, sha):
+        return os.path.join(self.objects_dir, sha[:2], f"{sha}.png")
+
+    def _near_duplicate(self, phash):
+        with self._lock:
+            for known, sha in self.phashes.items():
+                if hamming(phash, known) <= self.phash_distance:
+                    return sha
+        return None
+
+    def put(self, data, name, test=None, step=None):
+        """Store data once and record the capture; returns the object sha it maps to"""
+        sha = hashlib.sha256(data).hexdigest()
+        entry = {'sha': sha, 'name': name, 'test': test, 'step': step,
+                 'worker': workers.worker_id(), 'time': time.time(), 'bytes': len(data)}
+
+        if self.phash_distance and not os.path.exists(self.object_path(sha)):
+            phash = difference_hash(data)
+            if phash:
+                entry['phash'] = phash
+                similar = self._near_duplicate(phash)
+                if similar:
+                    # sha names the stored image; captured_sha the bytes that were not kept
+                    entry['sha'], entry['captured_sha'] = similar, sha
+
+        path = self.object_path(entry['sha'])
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            try:
+                # Unlike os.replace, linking fails if another worker stored the
+                # object first, so only one capture is counted as stored
+                os.link(tmp_path, path)
+                entry['stored'] = True
+            except FileExistsError:
+                pass
+            finally:
+                os.remove(tmp_path)
+        if entry.get('phash'):
+            with self._lock:
+                self.phashes[entry['phash']] = entry['sha']
+
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._lock:
+            with open(self.manifest_path, 'a') as f:
+                f.write(line)
+        return entry['sha']
+
+
+def read_manifest(root=STORE_DIR):
+    """All manifest entries from every worker's manifest file"""
+    entries = []
+    for path in sorted(glob.glob(os.path.join(root, 'manifest*.jsonl'))):
+        with open(path) as f:
+            entries.extend(json.loads(line) for line in f if line.strip())
+    return entries
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Process-wide store shared by the screenshot writer threads"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            os.makedirs(STORE_DIR, exist_ok=True)
+            _store = ScreenshotStore()
+    return _store
+
+
+def main(root=STORE_DIR):
+    entries = read_manifest(root)
+    if not entries:
+        print(f"No screenshots recorded in {root}")
+        return
+    captured = sum(entry['bytes'] for entry in entries)
+    stored = sum(entry['bytes'] for entry in entries if entry.get('stored'))
+    objects = {entry['sha'] for entry in entries}
+    near = sum(1 for entry in entries if entry.get('captured_sha'))
+    print(f"{len(entries)} captures -> {len(objects)} objects ({near} near-duplicates collapsed)")
+    print(f"{captured / 1e6:.1f} MB captured, {stored / 1e6:.1f} MB stored")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,170 @@
+"""Background writer for screenshots.
+
+Capturing a screenshot only needs one WebDriver round trip; decoding the
+payload and writing it to disk can happen later. ``capture`` hands the
+base64 payload to a small pool of writer threads through a bounded queue.
+When the queue is full, ``capture`` blocks until a slot frees up, so a
+burst of screenshots cannot use unbounded memory. ``flush`` waits for
+every queued screenshot to be on disk.
+
+The ``CLEANCITY_SCREENSHOTS`` policy decides what gets written:
+``always`` writes every capture, ``on-failure`` keeps the last
+``CLEANCITY_SCREENSHOT_BUFFER`` captures of the current test in memory and
+writes them only if the test fails, and ``off`` skips capturing entirely.
+
+With ``CLEANCITY_SCREENSHOT_STORE`` set, the writers put captures into the
+deduplicated store in ``screenshot_store`` instead of one file per capture.
+"""
+import atexit
+import base64
+import collections
+import logging
+import os
+import queue
+import threading
+import time
+
+from cleancity_testkit import instrumentation, screenshot_store
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = int(os.environ.get('CLEANCITY_SCREENSHOT_QUEUE', '32'))
+WRITER_THREADS = 2
+
+POLICY_ENV_VAR = 'CLEANCITY_SCREENSHOTS'
+POLICIES = ('always', 'on-failure', 'off')
+DEFAULT_POLICY = 'always'
+BUFFER_SIZE = int(os.environ.get('CLEANCITY_SCREENSHOT_BUFFER', '10'))
+
+
+class ScreenshotWriter:
+    """Pool of threads writing queued screenshots to disk"""
+
+    def __init__(self, queue_size=QUEUE_SIZE, threads=WRITER_THREADS):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stats = {'written': 0, 'failed': 0, 'blocked_seconds': 0.0}
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._run, name=f'screenshot-writer-{i}', daemon=True)
+            for i in range(threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, path, payload, test=None, step=None):
+        """Queue a base64 screenshot payload for writing to path, blocking while the queue is full"""
+        item = (path, payload, test, step)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            start = time.monotonic()
+            self.queue.put(item)
+            with self._lock:
+                self.stats['blocked_seconds'] += time.monotonic() - start
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                path, payload, test, step = item
+                data = base64.b64decode(payload)
+                if screenshot_store.enabled():
+                    screenshot_store.get_store().put(data, path, test, step)
+                else:
+                    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                    with open(path, 'wb') as f:
+                        f.write(data)
+                with self._lock:
+                    self.stats['written'] += 1
+            except Exception as e:
+                logger.error(f"Failed to write screenshot {item[0]}: {str(e)}")
+                with self._lock:
+                    self.stats['failed'] += 1
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Block until every queued screenshot has been written"""
+        self.queue.join()
+
+    def close(self):
+        """Flush and stop the writer threads"""
+        self.flush()
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+_writer = None
+# Captures of the current test held back by the on-failure policy
+_buffer = collections.deque(maxlen=BUFFER_SIZE)
+_current_test = None
+
+
+def active_policy():
+    """Screenshot policy selected for this run"""
+    policy = os.environ.get(POLICY_ENV_VAR, DEFAULT_POLICY)
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown screenshot policy '{policy}'. Choose from: {', '.join(POLICIES)}")
+    return policy
+
+
+def get_writer():
+    """Process-wide screenshot writer, flushed and stopped at exit"""
+    global _writer
+    if _writer is None:
+        _writer = ScreenshotWriter()
+        atexit.register(_finish)
+    return _writer
+
+
+def begin_test(test_id):
+    """Attribute the following captures to test_id"""
+    global _current_test
+    _current_test = test_id
+
+
+def capture(driver, path, step=None):
+    """Capture the current page for path according to the policy; returns path, or None when off"""
+    policy = active_policy()
+    if policy == 'off':
+        return None
+    with instrumentation.phase('screenshots'):
+        payload = driver.get_screenshot_as_base64()
+    item = (path, payload, _current_test, step or os.path.splitext(os.path.basename(path))[0])
+    if policy == 'on-failure':
+        _buffer.append(item)
+    else:
+        get_writer().submit(*item)
+    return path
+
+
+def end_test(failed):
+    """Write the buffered captures if the test failed, then start a fresh buffer"""
+    if failed and _buffer:
+        logger.info(f"Test failed, writing its last {len(_buffer)} screenshots")
+        writer = get_writer()
+        for item in _buffer:
+            writer.submit(*item)
+    _buffer.clear()
+    flush()
+
+
+def flush():
+    """Wait for pending screenshots, if any writer has been started"""
+    if _writer is not None:
+        _writer.flush()
+
+
+def _finish():
+    global _writer
+    if _writer is None:
+        return
+    _writer.close()
+    stats = _writer.stats
+    logger.info(f"Screenshots: {stats['written']} written, {stats['failed']} failed, "
+                f"{stats['blocked_seconds']:.1f}s blocked on a full queue")
+    _writer = None
@@ -0,0 +1,137 @@
+"""Local stand-in server for the CleanCity app.
+
+Serves the static app in the repository root (``index.html``,
+``script.js``, ``styles.css``) from a threaded HTTP server on an ephemeral
+localhost port, so page loads do not depend on the network. Only those
+files are served: other paths without a dot in them fall back to
+``index.html`` like the hosted single-page app, and anything else is a
+404. Set ``CLEANCITY_BASE_URL`` to test a deployed site
+instead; the local server is then never started. ``build_id`` identifies
+the app under test so state saved against one build is not reused on the
+next.
+"""
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import threading
+import urllib.parse
+import urllib.request
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+BASE_URL_ENV_VAR = 'CLEANCITY_BASE_URL'
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILES = ('index.html', 'script.js', 'styles.css')
+
+
+class AppRequestHandler(SimpleHTTPRequestHandler):
+    """The app's files only, with a single-page-app fallback and quiet logging"""
+
+    def send_head(self):
+        path = urllib.parse.urlsplit(self.path).path.lstrip('/')
+        if path not in APP_FILES:
+            # The root also holds .git, caches and reports, which are not the app's to serve
+            if '.' in path:
+                self.send_error(HTTPStatus.NOT_FOUND, 'Not part of the app')
+                return None
+            self.path = '/index.html'
+        return super().send_head()
+
+    def end_headers(self):
+        # Every test should see the files as they are on disk
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class AppServer:
+    """Threaded HTTP server for the app on 127.0.0.1"""
+
+    def __init__(self, root=APP_ROOT, port=0):
+        self.root = root
+        handler = functools.partial(AppRequestHandler, directory=root)
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='cleancity-app-server', daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        logger.info(f"Serving {self.root} at {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+_server = None
+_build_id = None
+_lock = threading.Lock()
+
+
+def base_url():
+    """URL of the app under test: CLEANCITY_BASE_URL, or the local server started on first use"""
+    global _server
+    override = os.environ.get(BASE_URL_ENV_VAR)
+    if override:
+        return override.rstrip('/')
+    with _lock:
+        if _server is None:
+            _server = AppServer().start()
+            atexit.register(stop)
+    return _server.url
+
+
+def app_origin():
+    """Origin of the app under test, or None while the local server is not running"""
+    override = os.environ.get(BASE_URL_ENV_VAR)
+    if override:
+        parsed = urllib.parse.urlsplit(override)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return _server.url if _server is not None else None
+
+
+def stop():
+    """Shut the local server down if it is running"""
+    global _server
+    with _lock:
+        if _server is not None:
+            _server.stop()
+            _server = None
+
+
+def build_id():
+    """Short hash of the app under test, computed once per process
+
+    The local app is hashed from its files. A deployed site is hashed from
+    its entry page, which names its content-hashed bundles, or from its URL
+    if the page cannot be fetched.
+    """
+    global _build_id
+    if _build_id is None:
+        digest = hashlib.sha1()
+        override = os.environ.get(BASE_URL_ENV_VAR)
+        if override:
+            try:
+                with urllib.request.urlopen(override, timeout=10) as response:
+                    digest.update(response.read())
+            except Exception as e:
+                logger.warning(f"Could not fetch {override} to identify its build: {str(e)}")
+                digest.update(override.rstrip('/').encode())
+        else:
+            for name in APP_FILES:
+                with open(os.path.join(APP_ROOT, name), 'rb') as f:
+                    digest.update(f.read())
+        _build_id = digest.hexdigest()[:12]
+    return _build_id
@@ -0,0 +1,67 @@
+"""Authenticated sessions created directly in localStorage.
+
+The app keeps all auth state client-side: a user list and a current-user
+record. The vanilla build (``script.js``/``dataService.js``) uses
+``cleancity_users`` and ``currentUser``; the React ``authService.js`` uses
+``ccUsers`` and ``ccUser``. Writing both lets a test start authenticated
+after a single page load instead of going through the login form.
+"""
+import time
+
+from cleancity_testkit import workers
+
+DEFAULT_USER = {
+    'name': 'Test User',
+    'password': 'password123',
+    'role': 'user',
+}
+
+USER_LIST_KEYS = ('cleancity_users', 'ccUsers')
+
+INJECT_SESSION_SCRIPT = """
+var user = arguments[0], listKeys = arguments[1], sessions = arguments[2];
+listKeys.forEach(function (key) {
+  var users = [];
+  try { users = JSON.parse(localStorage.getItem(key)) || []; } catch (e) {}
+  users = users.filter(function (u) { return u.email !== user.email; });
+  users.push(user);
+  localStorage.setItem(key, JSON.stringify(users));
+});
+Object.keys(sessions).forEach(function (key) {
+  localStorage.setItem(key, JSON.stringify(sessions[key]));
+});
+"""
+
+
+def make_user(user=None):
+    """Complete user record with the fields both app builds expect.
+
+    Without an explicit email each call gets a worker-unique address.
+    """
+    record = dict(DEFAULT_USER, email=workers.unique_email('test', 'example.com'))
+    record.update(user or {})
+    record.setdefault('id', str(int(time.time() * 1000)))
+    record.setdefault('createdAt', time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()))
+    return record
+
+
+def current_user_records(user):
+    """Current-user values keyed by the localStorage key each build reads"""
+    return {
+        # script.js only keeps the public fields in the session
+        'currentUser': {key: user[key] for key in ('id', 'email', 'name', 'role')},
+        # authService.js stores the whole user
+        'ccUser': user,
+    }
+
+
+def inject_session(driver, base_url, user=None, route=''):
+    """Write a registered, logged-in user into localStorage and load route"""
+    record = make_user(user)
+    origin = base_url.rstrip('/')
+    # localStorage is per origin, so we must be on the app before writing
+    if not driver.current_url.startswith(origin):
+        driver.get(base_url)
+    driver.execute_script(INJECT_SESSION_SCRIPT, record, list(USER_LIST_KEYS), current_user_records(record))
+    driver.get(origin + route)
+    return record
@@ -0,0 +1,107 @@
+"""Responsive viewport matrix using device-metrics emulation in tabs.
+
+Resizing the real window and reloading for every screen size runs the
+sizes strictly one after another. Instead each device gets its own tab with
+``Emulation.setDeviceMetricsOverride`` (which only affects that tab) and
+all tabs start loading before any of them is checked, so page loads
+overlap and adding devices adds little more than the per-tab checks.
+"""
+import logging
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cleancity_testkit import budget, instrumentation, waits
+
+logger = logging.getLogger(__name__)
+
+# width/height are CSS pixels; scale is the device pixel ratio
+DEVICES = {
+    'iphone-se': {'width': 320, 'height': 568, 'scale': 2, 'mobile': True},
+    'iphone-8': {'width': 375, 'height': 667, 'scale': 2, 'mobile': True},
+    'iphone-xr': {'width': 414, 'height': 896, 'scale': 2, 'mobile': True},
+    'ipad': {'width': 768, 'height': 1024, 'scale': 2, 'mobile': True},
+    'ipad-landscape': {'width': 1024, 'height': 768, 'scale': 2, 'mobile': True},
+    'laptop': {'width': 1366, 'height': 768, 'scale': 1, 'mobile': False},
+    'desktop': {'width': 1920, 'height': 1080, 'scale': 1, 'mobile': False},
+}
+
+LOAD_TIMEOUT = 20
+
+
+def emulate(driver, device):
+    """Make the current tab render as device without resizing the window"""
+    driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+        'width': device['width'],
+        'height': device['height'],
+        'deviceScaleFactor': device['scale'],
+        'mobile': device['mobile'],
+    })
+
+
+def clear_emulation(driver):
+    """Return the current tab to the real window metrics"""
+    driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+
+
+def run_matrix(driver, url, devices, check, timeout=LOAD_TIMEOUT):
+    """Load url once per device in parallel tabs and run check in each.
+
+    ``check(driver, name, device)`` is called with the device's tab active
+    and returns a dict of results. Returns ``{name: result}``; a device
+    whose load or check raised gets ``{'error': message}``.
+    """
+    original = driver.current_window_handle
+    tabs = {}
+    results = {}
+    start = time.monotonic()
+    try:
+        # Start every load before checking any, so they overlap
+        for name, device in devices.items():
+            driver.switch_to.new_window('tab')
+            tabs[name] = driver.current_window_handle
+            waits.install_app_hook(driver)
+            emulate(driver, device)
+            # Assigning location returns immediately, unlike driver.get
+            driver.execute_script("window.location.href = arguments[0];", url)
+
+        for name, device in devices.items():
+            driver.switch_to.window(tabs[name])
+            try:
+                with instrumentation.timed_wait('viewport_load', timeout):
+                    WebDriverWait(driver, budget.timeout(timeout), poll_frequency=waits.POLL_FREQUENCY).until(
+                        lambda d: d.current_url.startswith(url.rstrip('/'))
+                        and d.execute_script("return document.readyState;") == 'complete'
+                    )
+                results[name] = check(driver, name, device)
+            except Exception as e:
+                logger.error(f"Viewport {name} failed: {str(e)}")
+                results[name] = {'error': str(e)}
+    finally:
+        for handle in tabs.values():
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception as e:
+                logger.debug(f"Could not close viewport tab: {str(e)}")
+        driver.switch_to.window(original)
+
+    logger.info(f"Checked {len(devices)} viewports in {time.monotonic() - start:.1f}s")
+    return results
+
+
+def format_table(results, devices, columns):
+    """Render one row per device; columns are (heading, function(result)) pairs"""
+    headings = ['device', 'size'] + [heading for heading, _ in columns]
+    rows = []
+    for name, result in results.items():
+        device = devices[name]
+        row = [name, f"{device['width']}x{device['height']}"]
+        if 'error' in result:
+            row += ['error'] + [''] * (len(columns) - 1)
+        else:
+            row += [str(value(result)) for _, value in columns]
+        rows.append(row)
+    widths = [max(len(row[i]) for row in [headings] + rows) for i in range(len(headings))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in [headings] + rows]
+    return "\n".join(lines)
@@ -0,0 +1,179 @@
+"""Condition-based waits that replace fixed ``time.sleep`` calls.
+
+Every primitive polls a browser-side condition and returns as soon as it
+holds, or raises ``TimeoutException`` once ``timeout`` seconds have passed,
+so a wait never costs more than its upper bound. The bound is also cut to
+what is left of the running test's budget (see ``budget``).
+
+The app hook below is injected into every new document (and lazily into
+pages loaded before it was registered). It tracks pending ``setTimeout``
+callbacks, which is how the app's services simulate API latency, and the
+time of the last DOM mutation.
+"""
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cleancity_testkit import budget, instrumentation
+
+logger = logging.getLogger(__name__)
+
+POLL_FREQUENCY = 0.05
+
+# Timers longer than this are treated as background work (e.g. the 5 s
+# auto-hide on flash messages) rather than something a step waits for
+DEFAULT_MAX_TIMER_MS = 1500
+DEFAULT_QUIET_MS = 150
+
+APP_HOOK_SCRIPT = """
+(function () {
+  if (window.__ccHook) { return; }
+  var hook = window.__ccHook = {pending: {}, lastMutation: Date.now()};
+  var nativeSetTimeout = window.setTimeout;
+  var nativeClearTimeout = window.clearTimeout;
+  window.setTimeout = function (callback, delay) {
+    var args = Array.prototype.slice.call(arguments, 2);
+    var id = nativeSetTimeout.call(window, function () {
+      delete hook.pending[id];
+      return typeof callback === 'function' ? callback.apply(this, args) : (0, eval)(callback);
+    }, delay);
+    hook.pending[id] = Number(delay) || 0;
+    return id;
+  };
+  window.clearTimeout = function (id) {
+    delete hook.pending[id];
+    return nativeClearTimeout.call(window, id);
+  };
+  var observe = function () {
+    new MutationObserver(function () { hook.lastMutation = Date.now(); }).observe(
+      document.documentElement,
+      {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+  };
+  if (document.documentElement) { observe(); }
+  else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+"""
+
+PENDING_TIMERS_SCRIPT = APP_HOOK_SCRIPT + """
+var maxDelay = arguments[0];
+var pending = window.__ccHook.pending;
+return Object.keys(pending).filter(function (id) { return pending[id] <= maxDelay; }).length;
+"""
+
+MS_SINCE_MUTATION_SCRIPT = APP_HOOK_SCRIPT + """
+return Date.now() - window.__ccHook.lastMutation;
+"""
+
+SETTLED_SCRIPT = APP_HOOK_SCRIPT + """
+var maxDelay = arguments[0], quietMs = arguments[1];
+var pending = window.__ccHook.pending;
+var busy = Object.keys(pending).some(function (id) { return pending[id] <= maxDelay; });
+return document.readyState !== 'loading' && !busy
+  && Date.now() - window.__ccHook.lastMutation >= quietMs;
+"""
+
+
+def install_app_hook(driver):
+    """Register the app hook for every document the driver loads"""
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': APP_HOOK_SCRIPT})
+    except WebDriverException as e:
+        # Without CDP the hook is installed on demand by the first wait
+        logger.debug(f"Could not register app hook via CDP: {str(e)}")
+
+
+def _until(driver, condition, timeout, message, name):
+    bounded = budget.timeout(timeout)
+    start = time.monotonic()
+    with instrumentation.timed_wait(name, timeout):
+        try:
+            return WebDriverWait(driver, bounded, poll_frequency=POLL_FREQUENCY).until(condition, message)
+        except TimeoutException:
+            budget.record_failure(name, time.monotonic() - start)
+            raise
+
+
+def url_changed(driver, old_url, timeout=10):
+    """Wait until the URL differs from old_url; returns the new URL"""
+    return _until(
+        driver,
+        lambda d: d.current_url if d.current_url != old_url else False,
+        timeout,
+        f"URL did not change from {old_url} within {timeout}s",
+        'url_changed',
+    )
+
+
+def submitted(driver, old_url, locator, timeout=10):
+    """Wait until a submitted form has navigated away from old_url or shown the locator's element"""
+    def condition(d):
+        if d.current_url != old_url:
+            return True
+        return any(e.is_displayed() for e in d.find_elements(*locator))
+
+    return _until(driver, condition, timeout, f"Still on {old_url} without {locator} after {timeout}s", 'submitted')
+
+
+def route_rendered(driver, path=None, locator=None, timeout=10):
+    """Wait until the URL contains path and the locator's element is visible"""
+    def condition(d):
+        if path and path.lower() not in d.current_url.lower():
+            return False
+        if locator is None:
+            return d.execute_script("return document.readyState !== 'loading';")
+        visible = [e for e in d.find_elements(*locator) if e.is_displayed()]
+        return visible[0] if visible else False
+
+    return _until(driver, condition, timeout, f"Route {path or ''} {locator or ''} not rendered within {timeout}s",
+                  'route_rendered')
+
+
+def element_count_stable(driver, locator, stable_ms=300, timeout=10):
+    """Wait until the number of matching elements stops changing; returns the count"""
+    state = {'count': None, 'since': time.monotonic()}
+
+    def condition(d):
+        count = len(d.find_elements(*locator))
+        now = time.monotonic()
+        if count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return count if (now - state['since']) * 1000 >= stable_ms else False
+
+    return _until(driver, condition, timeout, f"Count of {locator} not stable within {timeout}s", 'element_count_stable')
+
+
+def no_pending_timers(driver, max_delay_ms=DEFAULT_MAX_TIMER_MS, timeout=10):
+    """Wait until no short setTimeout callbacks (simulated fetches, redirects) are pending"""
+    return _until(
+        driver,
+        lambda d: d.execute_script(PENDING_TIMERS_SCRIPT, max_delay_ms) == 0,
+        timeout,
+        f"Timers still pending after {timeout}s",
+        'no_pending_timers',
+    )
+
+
+def dom_quiescent(driver, quiet_ms=DEFAULT_QUIET_MS, timeout=10):
+    """Wait until the DOM has not changed for quiet_ms milliseconds"""
+    return _until(
+        driver,
+        lambda d: d.execute_script(MS_SINCE_MUTATION_SCRIPT) >= quiet_ms,
+        timeout,
+        f"DOM still changing after {timeout}s",
+        'dom_quiescent',
+    )
+
+
+def settled(driver, quiet_ms=DEFAULT_QUIET_MS, max_delay_ms=DEFAULT_MAX_TIMER_MS, timeout=10):
+    """Wait for a loaded document, no pending short timers and a quiet DOM, in one call per poll"""
+    return _until(
+        driver,
+        lambda d: d.execute_script(SETTLED_SCRIPT, max_delay_ms, quiet_ms),
+        timeout,
+        f"Page did not settle within {timeout}s",
+        'settled',
+    )
@@ -0,0 +1,65 @@
+"""Per-worker isolation for running the suite under pytest-xdist.
+
+Each xdist worker is a separate process with ``PYTEST_XDIST_WORKER`` set
+(``gw0``, ``gw1``, ...). Files a worker writes and the accounts it creates
+carry that id, so workers never overwrite each other's logs, screenshots
+or registered users. Outside xdist the id is ``main`` and paths keep their
+original names.
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import time
+
+MAIN = 'main'
+
+SCREENSHOT_DIR = 'screenshots'
+
+_counter = itertools.count(1)
+_profile_dir = None
+
+
+def worker_id():
+    """xdist worker id such as ``gw0``, or ``main`` when not running under xdist"""
+    return os.environ.get('PYTEST_XDIST_WORKER', MAIN)
+
+
+def is_worker():
+    return worker_id() != MAIN
+
+
+def worker_path(path):
+    """Tag a file path with the worker id: ``test_execution.log`` -> ``test_execution.gw0.log``"""
+    if not is_worker():
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{worker_id()}{ext}"
+
+
+def screenshot_path(filename):
+    """Path for a screenshot in this worker's directory"""
+    directory = os.path.join(SCREENSHOT_DIR, worker_id()) if is_worker() else SCREENSHOT_DIR
+    return os.path.join(directory, filename)
+
+
+def unique_email(local_part='test', domain='example.com'):
+    """Email address no other worker, run or call in this process will produce"""
+    # Millisecond timestamp separates runs, the counter separates calls
+    return f"{local_part}.{worker_id()}.{int(time.time() * 1000)}{next(_counter)}@{domain}"
+
+
+def chrome_profile_dir():
+    """Fresh Chrome user data directory owned by this worker process"""
+    global _profile_dir
+    if _profile_dir is None:
+        _profile_dir = tempfile.mkdtemp(prefix=f'cleancity-chrome-{worker_id()}-')
+    return _profile_dir
+
+
+def remove_chrome_profile_dir():
+    """Delete this worker's Chrome user data directory"""
+    global _profile_dir
+    if _profile_dir is not None:
+        shutil.rmtree(_profile_dir, ignore_errors=True)
+        _profile_dir = None
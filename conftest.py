@@ -0,0 +1,182 @@
+"""pytest configuration for the CleanCity UI test suite"""
+import glob
+import logging
+import os
+import shutil
+
+import pytest
+
+from cleancity_testkit import budget, dom, durations, impact, instrumentation, profiles, resources, screenshot_store, screenshots, workers
+from cleancity_testkit.chromedriver_cache import resolve_chromedriver
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('cleancity', 'CleanCity UI tests')
+    group.addoption(
+        '--profile',
+        action='store',
+        default=None,
+        choices=sorted(profiles.PROFILES),
+        help=f"Chrome run profile (default: ${profiles.PROFILE_ENV_VAR} or {profiles.DEFAULT_PROFILE})",
+    )
+    group.addoption(
+        '--screenshots',
+        action='store',
+        default=None,
+        choices=screenshots.POLICIES,
+        help=f"When to write screenshots (default: ${screenshots.POLICY_ENV_VAR} or {screenshots.DEFAULT_POLICY})",
+    )
+    group.addoption(
+        '--screenshot-store',
+        action='store_true',
+        default=False,
+        help=f"Deduplicate screenshots into {screenshot_store.STORE_DIR} (also ${screenshot_store.STORE_ENV_VAR}=1)",
+    )
+    group.addoption(
+        '--capture-dom',
+        action='store_true',
+        default=False,
+        help=f"Save compressed page source at every marked step, not only on failure (also ${dom.DEBUG_ENV_VAR}=1)",
+    )
+    group.addoption(
+        '--instrument',
+        action='store_true',
+        default=False,
+        help=f"Record WebDriver command, wait and sleep timings (also ${instrumentation.INSTRUMENT_ENV_VAR}=1)",
+    )
+    group.addoption(
+        '--resource-report',
+        action='store_true',
+        default=False,
+        help=f"Count requests blocked by resource policies (also ${resources.REPORT_ENV_VAR}=1 or --instrument)",
+    )
+    group.addoption(
+        '--test-budget',
+        action='store',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help=f"Time every wait in a test draws from (default: ${budget.BUDGET_ENV_VAR} or {budget.DEFAULT_BUDGET:.0f})",
+    )
+    group.addoption(
+        '--schedule',
+        action='store',
+        default=None,
+        choices=durations.SCHEDULES,
+        help=f"How -n spreads tests over workers (default: ${durations.SCHEDULE_ENV_VAR} or {durations.DEFAULT_SCHEDULE})",
+    )
+    group.addoption(
+        '--changed-since',
+        action='store',
+        default=None,
+        metavar='REF',
+        help=f"Run only tests covering app files changed since the git REF, plus the smoke set (also ${impact.CHANGED_SINCE_ENV_VAR})",
+    )
+
+
+def pytest_configure(config):
+    # Expose CLI choices through the environment so the shared driver and
+    # any xdist workers pick them up
+    profile = config.getoption('--profile')
+    if profile:
+        os.environ[profiles.PROFILE_ENV_VAR] = profile
+    policy = config.getoption('--screenshots')
+    if policy:
+        os.environ[screenshots.POLICY_ENV_VAR] = policy
+    if config.getoption('--screenshot-store'):
+        os.environ[screenshot_store.STORE_ENV_VAR] = '1'
+    if config.getoption('--capture-dom'):
+        os.environ[dom.DEBUG_ENV_VAR] = '1'
+    if config.getoption('--instrument'):
+        os.environ[instrumentation.INSTRUMENT_ENV_VAR] = '1'
+    if config.getoption('--resource-report'):
+        os.environ[resources.REPORT_ENV_VAR] = '1'
+    test_budget = config.getoption('--test-budget')
+    if test_budget is not None:
+        os.environ[budget.BUDGET_ENV_VAR] = str(test_budget)
+    schedule = config.getoption('--schedule')
+    if schedule:
+        os.environ[durations.SCHEDULE_ENV_VAR] = schedule
+    changed_since = config.getoption('--changed-since')
+    if changed_since:
+        os.environ[impact.CHANGED_SINCE_ENV_VAR] = changed_since
+
+    if workers.is_worker():
+        return
+    # Only the controller removes logs left by a previous parallel run;
+    # workers each truncate their own file when they start
+    for path in glob.glob('test_execution.gw*.log'):
+        os.remove(path)
+    for path in glob.glob('test_execution.gw*_payloads'):
+        shutil.rmtree(path, ignore_errors=True)
+    if getattr(config.option, 'numprocesses', None) and not config.option.collectonly:
+        # Resolve chromedriver once so workers do not race to download it;
+        # if that fails each worker reports the error when it starts Chrome
+        try:
+            resolve_chromedriver()
+        except Exception as e:
+            logger.warning(f"Could not pre-resolve chromedriver: {str(e)}")
+
+
+def order_stages(items):
+    """Move each class's stage_order tests ahead of its other tests, in that order
+
+    unittest collects methods sorted by name; stages that produce checkpoints
+    must run before the stages that restore them. Other tests keep their place.
+    """
+    slots = {}
+    for index, item in enumerate(items):
+        stage_order = getattr(getattr(item, 'cls', None), 'stage_order', None)
+        if stage_order:
+            slots.setdefault(item.cls, []).append(index)
+    for cls, indexes in slots.items():
+        def rank(index):
+            name = items[index].name
+            return cls.stage_order.index(name) if name in cls.stage_order else len(cls.stage_order)
+        ordered = [items[index] for index in sorted(indexes, key=lambda index: (rank(index), index))]
+        for index, item in zip(indexes, ordered):
+            items[index] = item
+
+
+def pytest_collection_modifyitems(config, items):
+    order_stages(items)
+    ref = os.environ.get(impact.CHANGED_SINCE_ENV_VAR)
+    if not ref:
+        return
+    # Workers make the same selection so their collections match the controller's
+    kept, deselected, lines = impact.filter_items(items, ref, cwd=str(config.rootpath))
+    items[:] = kept
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    reporter = config.pluginmanager.get_plugin('terminalreporter')
+    if reporter is not None and not workers.is_worker():
+        for line in lines if config.option.verbose > 0 else lines[:1]:
+            reporter.write_line(line)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption('dist') == 'load' and durations.schedule_name() == 'longest-first':
+        return durations.make_scheduler(config, log)
+    return None
+
+
+def pytest_runtest_logreport(report):
+    # Under xdist the controller sees every worker's reports
+    if not workers.is_worker():
+        durations.get_store().add(report)
+
+
+def pytest_sessionfinish(session):
+    if not workers.is_worker() and not session.config.option.collectonly:
+        durations.get_store().save()
+
+
+def pytest_terminal_summary(terminalreporter):
+    lines = durations.get_store().balance_report()
+    if lines:
+        terminalreporter.section('worker balance')
+        for line in lines:
+            terminalreporter.write_line(line)
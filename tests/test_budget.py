@@ -0,0 +1,56 @@
+"""Per-test wait budget with a fake clock"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from cleancity_testkit import budget, instrumentation
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(budget.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_timeout_is_cut_to_what_is_left(clock):
+    test_budget = budget.Budget('test_a', 10)
+    assert test_budget.timeout(5) == 5
+    clock[0] += 7
+    assert test_budget.timeout(5) == pytest.approx(3)
+    assert test_budget.clamped == 1 and not test_budget.exhausted
+
+
+def test_exhausted_budget_checks_once(clock):
+    test_budget = budget.Budget('test_a', 10)
+    clock[0] += 12
+    assert test_budget.timeout(5) == 0
+    assert test_budget.timeout(0) == 0
+    assert test_budget.exhausted and test_budget.clamped == 1
+
+
+def test_zero_budget_from_the_environment_applies(clock, monkeypatch):
+    monkeypatch.setenv(budget.BUDGET_ENV_VAR, '0')
+    # Keep the figures out of the report written at exit
+    monkeypatch.setattr(budget, '_results', {})
+    budget.begin_test('test_a')
+    try:
+        assert budget.timeout(10) == 0
+    finally:
+        budget.end_test()
+    assert budget.timeout(10) == 10
+
+
+def test_budget_wait_is_recorded_as_a_wait(monkeypatch):
+    recorder = instrumentation.Recorder()
+    monkeypatch.setattr(instrumentation, '_recorder', recorder)
+    budget.BudgetWait(object(), 2).until(lambda driver: True)
+    with pytest.raises(TimeoutException):
+        budget.BudgetWait(object(), 0.1, poll_frequency=0.05).until(visibility_of_nothing)
+    assert [(e['name'], e['cat'], e['ok'], e['args']['requested']) for e in recorder.events] == [
+        ('test_budget_wait_is_recorded_as_a_wait', 'waits', True, 2),
+        ('visibility_of_nothing', 'waits', False, 0.1),
+    ]
+
+
+def visibility_of_nothing(driver):
+    return False
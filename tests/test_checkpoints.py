@@ -0,0 +1,36 @@
+"""Checkpoint build keys and stage ordering, without a browser"""
+from types import SimpleNamespace
+
+from cleancity_testkit import checkpoints
+from conftest import order_stages
+
+
+class FakeDriver:
+    current_url = 'http://127.0.0.1:8000/'
+
+    def execute_script(self, script, *args):
+        assert script == checkpoints.SNAPSHOT_SCRIPT
+        return {'cleancity_user': '{"email": "a@example.com"}'}, {}
+
+
+def test_checkpoint_saved_for_another_build_is_ignored(tmp_path):
+    build = checkpoints.build_key('app-1', 'user@cleancity.com')
+    checkpoints.save(FakeDriver(), 'registered', {'user': 'a'}, build=build, checkpoint_dir=str(tmp_path))
+    assert checkpoints.load('registered', build=build, checkpoint_dir=str(tmp_path))['meta'] == {'user': 'a'}
+    for other in (checkpoints.build_key('app-2', 'user@cleancity.com'),
+                  checkpoints.build_key('app-1', 'someone@example.com')):
+        assert checkpoints.load('registered', build=other, checkpoint_dir=str(tmp_path)) is None
+
+
+def test_producing_stages_run_first_in_stage_order():
+    class Journey:
+        stage_order = ('test_register', 'test_login')
+
+    class Other:
+        pass
+
+    names = [(Other, 'test_a'), (Journey, 'test_admin'), (Journey, 'test_login'),
+             (Other, 'test_b'), (Journey, 'test_register'), (Journey, 'test_blog')]
+    items = [SimpleNamespace(cls=cls, name=name) for cls, name in names]
+    order_stages(items)
+    assert [item.name for item in items] == ['test_a', 'test_register', 'test_login', 'test_b', 'test_admin', 'test_blog']
@@ -0,0 +1,39 @@
+"""Page source capture on failure, without a browser"""
+import gzip
+import os
+import unittest
+
+from cleancity_testkit import dom, outcome
+
+
+class FakeDriver:
+    page_source = '<html><body><form id="login-form"></form></body></html>'
+
+
+def test_failing_test_captures_dom_after_last_mark(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(dom.DEBUG_ENV_VAR, raising=False)
+    monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+    monkeypatch.setattr(dom, 'compress', lambda text: (gzip.compress(text.encode('utf-8')), '.gz'))
+    driver = FakeDriver()
+    captured = {}
+
+    class Pages(unittest.TestCase):
+        def tearDown(self):
+            captured[self._testMethodName] = dom.end_test(driver, 'Pages', outcome.failed(self))
+
+        def test_pass(self):
+            dom.mark(driver, 'Pages', 'home_page')
+
+        def test_fail(self):
+            dom.mark(driver, 'Pages', 'login_page')
+            self.fail('deliberate')
+
+    unittest.TestSuite([Pages('test_pass'), Pages('test_fail')]).run(unittest.TestResult())
+
+    assert captured['test_pass'] is None
+    path = captured['test_fail']
+    assert os.path.basename(path).startswith('Pages_login_page_on_failure_')
+    assert os.listdir('screenshots') == [os.path.basename(path)]
+    with open(path, 'rb') as f:
+        assert gzip.decompress(f.read()).decode('utf-8') == FakeDriver.page_source
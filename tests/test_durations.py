@@ -0,0 +1,91 @@
+"""Duration history, worker balance and the longest-first scheduler"""
+import json
+from types import SimpleNamespace
+
+from cleancity_testkit import durations
+
+
+class FakeNode:
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.options = {'tx': [f"{workers}*popen"], 'maxschedchunk': None}
+
+    def getvalue(self, name):
+        return self.options[name]
+
+    getoption = getvalue
+
+
+def report(nodeid, when, duration, worker):
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duration, node=FakeNode(worker))
+
+
+def test_unknown_tests_are_estimated_at_the_median(tmp_path):
+    store = durations.DurationStore(str(tmp_path / 'durations.json'))
+    assert store.estimate('t::new') == durations.DEFAULT_ESTIMATE
+    store.history = {'t::a': 2.0, 't::b': 10.0, 't::c': 4.0}
+    assert store.estimate('t::a') == 2.0
+    assert store.estimate('t::new') == 4.0
+
+
+def test_save_smooths_into_the_history(tmp_path):
+    path = tmp_path / 'durations.json'
+    path.write_text(json.dumps({'t::a': 10.0}))
+    store = durations.DurationStore(str(path))
+    for when, seconds in (('setup', 1.0), ('call', 4.0), ('teardown', 1.0)):
+        store.add(report('t::a', when, seconds, 'gw0'))
+    store.add(report('t::b', 'call', 3.0, 'gw0'))
+    store.save()
+    assert json.loads(path.read_text()) == {'t::a': 8.0, 't::b': 3.0}
+
+
+def test_balance_report_lists_workers_and_imbalance(tmp_path):
+    store = durations.DurationStore(str(tmp_path / 'durations.json'))
+    store.add(report('t::a', 'call', 30.0, 'gw0'))
+    store.add(report('t::a', 'teardown', 0.0, 'gw0'))
+    store.add(report('t::b', 'call', 10.0, 'gw1'))
+    store.add(report('t::b', 'teardown', 0.0, 'gw1'))
+    assert store.balance_report() == [
+        'gw0: 30.0s busy, 1 tests',
+        'gw1: 10.0s busy, 1 tests',
+        'makespan 30.0s, mean 20.0s, imbalance +50% over an even split',
+    ]
+
+
+def test_balance_report_is_empty_for_one_worker(tmp_path):
+    store = durations.DurationStore(str(tmp_path / 'durations.json'))
+    store.add(report('t::a', 'call', 30.0, 'main'))
+    assert store.balance_report() == []
+
+
+def test_scheduler_hands_out_longest_first(tmp_path, monkeypatch):
+    store = durations.DurationStore(str(tmp_path / 'durations.json'))
+    store.history = {'t::short': 1.0, 't::long': 50.0, 't::medium': 10.0, 't::tiny': 0.5, 't::mid': 5.0}
+    monkeypatch.setattr(durations, '_store', store)
+    collection = ['t::short', 't::long', 't::medium', 't::tiny', 't::mid']
+    scheduler = durations.make_scheduler(FakeConfig(2), SimpleNamespace(loadsched=lambda *args: None))
+    nodes = [FakeNode('gw0'), FakeNode('gw1')]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+
+    # One running and one queued test per worker, longest first
+    assert [collection[i] for i in nodes[0].sent] == ['t::long', 't::mid']
+    assert [collection[i] for i in nodes[1].sent] == ['t::medium', 't::short']
+    scheduler.mark_test_complete(nodes[0], nodes[0].sent[0])
+    assert collection[nodes[0].sent[-1]] == 't::tiny'
+    scheduler.mark_test_complete(nodes[1], nodes[1].sent[0])
+    assert nodes[1].shutting_down
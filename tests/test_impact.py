@@ -0,0 +1,43 @@
+"""Change-impact selection over a fixed list of nodeids"""
+from cleancity_testkit import impact
+
+NODEIDS = [
+    'test_cleancity_ui.py::TestNavigation::test_navbar_links',
+    'test_cleancity_ui.py::TestLoginFunctionality::test_valid_login',
+    'test_cleancity_ui.py::TestUserJourney::test_blog_page',
+    'test_cleancity_ui.py::TestUserJourney::test_feedback',
+    'test_cleancity_ui.py::TestDashboard::test_dashboard_loading',
+    'test_cleancity_ui.py::TestResponsiveDesign::test_mobile_view',
+]
+SMOKE = NODEIDS[:2]
+
+
+def test_global_change_selects_everything():
+    selected, reasons = impact.select(NODEIDS, ['README.md', 'script.js'])
+    assert selected == NODEIDS
+    assert set(reasons.values()) == {'global change script.js'}
+
+
+def test_claimed_change_selects_its_tests_plus_smoke():
+    selected, reasons = impact.select(NODEIDS, ['src/services/dataService.js'])
+    assert selected == SMOKE + [NODEIDS[3], NODEIDS[4]]
+    assert reasons[NODEIDS[3]] == 'covers src/services/dataService.js'
+    assert reasons[NODEIDS[0]] == 'smoke'
+
+
+def test_class_level_coverage_applies_to_every_method():
+    selected, reasons = impact.select(NODEIDS, ['src/components/Dashboard.jsx'])
+    assert selected == SMOKE + [NODEIDS[4]]
+    assert reasons[NODEIDS[4]] == 'covers src/components/Dashboard.jsx'
+
+
+def test_unmapped_app_change_selects_everything():
+    selected, reasons = impact.select(NODEIDS, ['src/components/NewWidget.js'])
+    assert selected == NODEIDS
+    assert reasons[NODEIDS[2]] == 'unmapped change src/components/NewWidget.js'
+
+
+def test_ignored_and_non_app_changes_run_only_smoke():
+    selected, reasons = impact.select(NODEIDS, ['src/__tests__/Login.test.js', 'SELENIUM_TEST.md'])
+    assert selected == SMOKE
+    assert set(reasons.values()) == {'smoke'}
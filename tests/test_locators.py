@@ -0,0 +1,99 @@
+"""Locator cache behaviour against a fake browser"""
+import json
+
+from selenium.webdriver.common.by import By
+
+from cleancity_testkit import instrumentation, locators, probe, server
+
+LOGIN_EMAIL = [(By.NAME, 'email'), (By.ID, 'email'), (By.CSS_SELECTOR, "input[type='email']")]
+ADMIN_EMAIL = [(By.ID, 'email'), (By.XPATH, "//input[@type='email']")]
+
+
+class FakeDriver:
+    """Answers the build-id and probe scripts from a set of locators present on the page"""
+
+    current_url = 'http://localhost:3000/'
+
+    def __init__(self, present):
+        self.present = {tuple(locator) for locator in present}
+        self.probed = []
+
+    def execute_script(self, script, *args):
+        if script == locators.BUILD_ID_SCRIPT:
+            return '/static/js/main.1a2b3c.js'
+        assert script == probe.PROBE_SCRIPT
+        results = []
+        for candidates in args[0]:
+            candidates = [tuple(locator) for locator in candidates]
+            self.probed.append(candidates)
+            index = next((i for i, locator in enumerate(candidates) if locator in self.present), None)
+            results.append({'index': index, 'element': None if index is None else f'element:{candidates[index]}',
+                            'counts': []})
+        return results
+
+
+def test_winner_is_tried_first_next_time(tmp_path):
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    driver = FakeDriver([(By.ID, 'email')])
+    assert cache.resolve(driver, 'login.email', LOGIN_EMAIL) == f"element:{(By.ID, 'email')}"
+    assert cache.resolve(driver, 'login.email', LOGIN_EMAIL) == f"element:{(By.ID, 'email')}"
+    assert driver.probed[1][0] == (By.ID, 'email')
+    assert cache.stats['hits'] == 1 and cache.stats['misses'] == 1
+
+
+def test_cached_locator_outside_the_chain_is_ignored(tmp_path):
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    driver = FakeDriver([(By.XPATH, "//input[@type='email']"), (By.NAME, 'email')])
+    cache.resolve(driver, 'login.email', ADMIN_EMAIL)
+    cache.resolve(driver, 'login.email', LOGIN_EMAIL)
+    assert driver.probed[1] == LOGIN_EMAIL
+    assert cache.stats['demotions'] == 0
+    key = cache.key(driver, 'login.email')
+    assert (cache.entries[key]['by'], cache.entries[key]['value']) == (By.NAME, 'email')
+
+
+def test_stale_winner_is_demoted(tmp_path):
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    cache.resolve(FakeDriver([(By.NAME, 'email')]), 'login.email', LOGIN_EMAIL)
+    driver = FakeDriver([(By.CSS_SELECTOR, "input[type='email']")])
+    assert cache.resolve(driver, 'login.email', LOGIN_EMAIL) is not None
+    assert cache.stats['demotions'] == 1
+    entry = cache.entries[cache.key(driver, 'login.email')]
+    assert (entry['by'], entry['value']) == (By.CSS_SELECTOR, "input[type='email']")
+
+
+def test_miss_returns_none(tmp_path):
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    assert cache.resolve(FakeDriver([]), 'login.email', LOGIN_EMAIL) is None
+    assert cache.entries == {}
+
+
+def test_save_merges_entries_written_by_other_workers(tmp_path):
+    path = tmp_path / 'locators.json'
+    cache = locators.LocatorCache(str(path))
+    cache.resolve(FakeDriver([(By.ID, 'email')]), 'login.email', LOGIN_EMAIL)
+    path.write_text(json.dumps({'other|/|nav.login': {'by': By.LINK_TEXT, 'value': 'Login', 'chain_cost': 0.1}}))
+    cache.save()
+    saved = json.loads(path.read_text())
+    assert sorted(saved) == sorted(['other|/|nav.login', *cache.dirty_keys])
+
+
+def test_polling_lookup_is_recorded_as_a_wait(tmp_path, monkeypatch):
+    recorder = instrumentation.Recorder()
+    monkeypatch.setattr(instrumentation, '_recorder', recorder)
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    cache.resolve(FakeDriver([(By.ID, 'email')]), 'login.email', LOGIN_EMAIL, timeout=3)
+    waits = [event for event in recorder.events if event['cat'] == 'waits']
+    assert [(event['name'], event['args']['requested']) for event in waits] == [('probe_until', 3)]
+
+
+def test_local_app_is_keyed_by_its_content(tmp_path, monkeypatch):
+    monkeypatch.setenv(server.BASE_URL_ENV_VAR, 'http://localhost:3000')
+    monkeypatch.setattr(server, '_build_id', 'content-v1')
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    assert cache.key(FakeDriver([]), 'login.email') == 'content-v1|/|login.email'
+
+    # An edited script.js is a new build even though its URL is the same
+    monkeypatch.setattr(server, '_build_id', 'content-v2')
+    cache = locators.LocatorCache(str(tmp_path / 'locators.json'))
+    assert cache.key(FakeDriver([]), 'login.email') == 'content-v2|/|login.email'
@@ -0,0 +1,105 @@
+"""Per-test log buffering, without a browser"""
+import json
+import logging
+import unittest
+
+from cleancity_testkit import logs, outcome
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def record(msg, test_id='case', level=logging.INFO, **extra):
+    return logging.makeLogRecord(dict(name='test', levelno=level, levelname=logging.getLevelName(level),
+                                      msg=msg, test_id=test_id, **extra))
+
+
+def end_marker(test_id, failed):
+    return record('', test_id, test_end=True, failed=failed, elapsed_ms=12.0)
+
+
+def test_passing_test_leaves_one_summary_line():
+    target = ListHandler()
+    handler = logs.TestBufferHandler(target)
+    handler.handle(record('step one'))
+    handler.handle(record('step two'))
+    handler.handle(end_marker('case', failed=False))
+    assert [r.getMessage() for r in target.records] == ['PASSED case in 12 ms (2 buffered records dropped)']
+    assert target.records[0].levelname == 'INFO'
+
+
+def test_failing_test_writes_its_records_before_the_summary():
+    target = ListHandler()
+    handler = logs.TestBufferHandler(target)
+    handler.handle(record('step one'))
+    handler.handle(record('other test', test_id='other'))
+    handler.handle(end_marker('case', failed=True))
+    assert [r.getMessage() for r in target.records] == ['step one', 'FAILED case in 12 ms (1 buffered records written)']
+    assert target.records[-1].levelname == 'ERROR'
+    assert list(handler.buffers) == ['other']
+
+
+def test_warnings_and_records_outside_tests_pass_straight_through():
+    target = ListHandler()
+    handler = logs.TestBufferHandler(target)
+    handler.handle(record('slow page', level=logging.WARNING))
+    handler.handle(record('session start', test_id=None))
+    assert [r.getMessage() for r in target.records] == ['slow page', 'session start']
+    assert handler.buffers == {}
+
+
+def test_flush_pending_writes_unfinished_tests():
+    target = ListHandler()
+    handler = logs.TestBufferHandler(target)
+    handler.handle(record('interrupted'))
+    handler.flush_pending()
+    assert [r.getMessage() for r in target.records] == ['interrupted']
+    assert handler.buffers == {}
+
+
+def test_failing_test_records_reach_the_json_log(tmp_path, monkeypatch):
+    log_file = tmp_path / 'test_execution.log'
+    file_handler = logs.JsonLinesHandler(str(log_file), str(tmp_path / 'payloads'))
+    pipeline = logs.TestBufferHandler(file_handler)
+    # Stand-in for the queue: same filter, handled on this thread
+    pipeline.addFilter(logs.ContextFilter())
+    monkeypatch.setattr(logs, '_queue_handler', pipeline)
+    logger = logging.getLogger('cleancity_testkit.tests.logs')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(pipeline)
+
+    class Steps(unittest.TestCase):
+        def setUp(self):
+            logs.begin_test(self.id())
+
+        def tearDown(self):
+            logs.end_test(failed=outcome.failed(self))
+
+        def test_pass(self):
+            logger.info('passing step')
+
+        def test_fail(self):
+            logger.info('=== SUBMIT FORM ===')
+            logger.info('failing step')
+            self.fail('deliberate')
+
+    try:
+        unittest.TestSuite([Steps('test_pass'), Steps('test_fail')]).run(unittest.TestResult())
+    finally:
+        logger.removeHandler(pipeline)
+        file_handler.close()
+
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    messages = [entry['msg'] for entry in entries]
+    assert messages[0].startswith('PASSED ') and messages[0].endswith('(1 buffered records dropped)')
+    assert messages[1:3] == ['=== SUBMIT FORM ===', 'failing step']
+    assert entries[2]['step'] == 'SUBMIT FORM'
+    assert messages[3].startswith('FAILED ') and messages[3].endswith('(2 buffered records written)')
+    assert 'passing step' not in messages
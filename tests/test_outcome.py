@@ -0,0 +1,114 @@
+"""Failure detection in tearDown and what it flushes, without a browser"""
+import base64
+import json
+import os
+import unittest
+
+from cleancity_testkit import outcome, screenshots
+
+pytest_plugins = ['pytester']
+
+PNG = base64.b64encode(b'\x89PNG fake').decode()
+
+
+class FakeDriver:
+    page_source = '<html><body>failed here</body></html>'
+
+    def get_screenshot_as_base64(self):
+        return PNG
+
+
+def run(case_class, *names):
+    """{test name: outcome.failed(test) as seen by its tearDown} under the unittest runner"""
+    seen = {}
+
+    class Case(case_class):
+        def tearDown(self):
+            seen[self._testMethodName] = outcome.failed(self)
+            super().tearDown()
+
+    result = unittest.TestResult()
+    unittest.TestSuite(Case(name) for name in names).run(result)
+    return seen
+
+
+class Outcomes(unittest.TestCase):
+    # Run by test_failed_under_unittest, not collected on its own
+    __test__ = False
+
+    def test_pass(self):
+        pass
+
+    def test_fail(self):
+        self.fail('deliberate')
+
+    def test_error(self):
+        raise RuntimeError('deliberate')
+
+    def test_skip(self):
+        self.skipTest('deliberate')
+
+    @unittest.expectedFailure
+    def test_expected_failure(self):
+        self.fail('deliberate')
+
+
+def test_failed_under_unittest():
+    seen = run(Outcomes, 'test_pass', 'test_fail', 'test_error', 'test_skip', 'test_expected_failure')
+    assert seen == {'test_pass': False, 'test_fail': True, 'test_error': True,
+                    'test_skip': False, 'test_expected_failure': False}
+
+
+def test_failed_under_pytest(pytester):
+    pytester.makepyfile(test_cases="""
+        import json
+        import unittest
+
+        from cleancity_testkit import outcome
+
+        class Cases(unittest.TestCase):
+            def tearDown(self):
+                with open('seen.jsonl', 'a') as f:
+                    f.write(json.dumps([self._testMethodName, outcome.failed(self)]) + '\\n')
+
+            def test_pass(self):
+                pass
+
+            def test_fail(self):
+                self.fail('deliberate')
+
+            def test_error(self):
+                raise RuntimeError('deliberate')
+
+            def test_skip(self):
+                self.skipTest('deliberate')
+    """)
+    result = pytester.runpytest_inprocess('-p', 'no:cacheprovider')
+    result.assert_outcomes(passed=1, failed=2, skipped=1)
+    with open(pytester.path / 'seen.jsonl') as f:
+        seen = dict(json.loads(line) for line in f)
+    assert seen == {'test_pass': False, 'test_fail': True, 'test_error': True, 'test_skip': False}
+
+
+def test_failing_test_writes_buffered_screenshots(tmp_path, monkeypatch):
+    monkeypatch.setenv(screenshots.POLICY_ENV_VAR, 'on-failure')
+    driver = FakeDriver()
+
+    class Captures(unittest.TestCase):
+        def setUp(self):
+            screenshots.begin_test(self.id())
+
+        def tearDown(self):
+            screenshots.end_test(failed=outcome.failed(self))
+
+        def test_pass(self):
+            screenshots.capture(driver, str(tmp_path / 'pass_step.png'))
+
+        def test_fail(self):
+            screenshots.capture(driver, str(tmp_path / 'fail_step1.png'))
+            screenshots.capture(driver, str(tmp_path / 'fail_step2.png'))
+            self.fail('deliberate')
+
+    run(Captures, 'test_pass', 'test_fail')
+    assert sorted(os.listdir(tmp_path)) == ['fail_step1.png', 'fail_step2.png']
+    assert (tmp_path / 'fail_step1.png').read_bytes() == base64.b64decode(PNG)
@@ -0,0 +1,53 @@
+"""Blocked-request counting from a fake performance log"""
+import json
+
+from cleancity_testkit import instrumentation, profiles, resources
+
+
+def event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeDriver:
+    def __init__(self, entries):
+        self.entries = entries
+        self.drained = 0
+
+    def get_log(self, kind):
+        assert kind == 'performance'
+        self.drained += 1
+        entries, self.entries = self.entries, []
+        return entries
+
+
+def test_performance_log_is_off_unless_the_report_is_requested(monkeypatch):
+    monkeypatch.delenv(resources.REPORT_ENV_VAR, raising=False)
+    monkeypatch.delenv(instrumentation.INSTRUMENT_ENV_VAR, raising=False)
+    assert 'goog:loggingPrefs' not in profiles.build_chrome_options('ci-fast').to_capabilities()
+    driver = FakeDriver([event('Network.requestWillBeSent', requestId='1', request={'url': 'http://app/a.png'})])
+    resources.ResourceTracker(sizes_file='unused.json').collect(driver)
+    assert driver.drained == 0
+
+    monkeypatch.setenv(resources.REPORT_ENV_VAR, '1')
+    assert 'goog:loggingPrefs' in profiles.build_chrome_options('ci-fast').to_capabilities()
+
+
+def test_collect_counts_blocked_requests_and_forgets_the_rest(monkeypatch, tmp_path):
+    monkeypatch.setenv(resources.REPORT_ENV_VAR, '1')
+    tracker = resources.ResourceTracker(sizes_file=str(tmp_path / 'sizes.json'))
+    tracker.sizes = {'http://app/hero.jpg': 250000}
+    tracker.policy = 'functional'
+    tracker.collect(FakeDriver([
+        event('Network.requestWillBeSent', requestId='1', request={'url': 'http://app/hero.jpg'}),
+        event('Network.requestWillBeSent', requestId='2', request={'url': 'http://app/font.woff2'}),
+        event('Network.requestWillBeSent', requestId='3', request={'url': 'http://app/slow.js'}),
+        event('Network.loadingFailed', requestId='1', blockedReason='inspector'),
+        event('Network.loadingFailed', requestId='2', blockedReason='inspector'),
+    ]))
+    assert tracker.stats['functional'] == {'requests': 2, 'bytes': 250000, 'unknown_size': 1}
+    assert tracker.requests == {}
+
+
+def test_ci_fast_leaves_images_to_the_resource_policy():
+    arguments = profiles.build_chrome_options('ci-fast').arguments
+    assert not any('imagesEnabled' in argument for argument in arguments)
@@ -0,0 +1,49 @@
+"""Screenshot store deduplication and manifest"""
+import hashlib
+
+from cleancity_testkit import screenshot_store
+
+
+def test_identical_captures_are_stored_once(tmp_path, capsys):
+    store = screenshot_store.ScreenshotStore(root=str(tmp_path), phash_distance=0)
+    first = store.put(b'login form', 'a.png', test='TestLogin::test_a', step='login_page')
+    second = store.put(b'login form', 'b.png', test='TestLogin::test_b', step='login_page')
+    other = store.put(b'dashboard', 'c.png', test='TestLogin::test_b', step='dashboard')
+
+    assert first == second != other
+    with open(store.object_path(first), 'rb') as f:
+        assert f.read() == b'login form'
+    objects = [path for path in tmp_path.joinpath('objects').rglob('*') if path.is_file()]
+    assert len(objects) == 2
+
+    entries = screenshot_store.read_manifest(str(tmp_path))
+    assert [(entry['name'], entry['sha'], entry.get('stored', False)) for entry in entries] == [
+        ('a.png', first, True), ('b.png', first, False), ('c.png', other, True)]
+    assert entries[1]['test'] == 'TestLogin::test_b' and entries[1]['step'] == 'login_page'
+
+    screenshot_store.main(str(tmp_path))
+    assert '3 captures -> 2 objects' in capsys.readouterr().out
+
+
+
+def test_object_stored_by_another_worker_is_not_counted_again(tmp_path, monkeypatch):
+    store = screenshot_store.ScreenshotStore(root=str(tmp_path), phash_distance=0)
+    sha = store.put(b'login form', 'a.png')
+    # Another worker finished writing between our exists check and our write
+    monkeypatch.setattr(screenshot_store.os.path, 'exists', lambda path: False)
+    assert store.put(b'login form', 'b.png') == sha
+    entries = screenshot_store.read_manifest(str(tmp_path))
+    assert [entry.get('stored', False) for entry in entries] == [True, False]
+    assert [path.name for path in tmp_path.joinpath('objects').rglob('*') if path.is_file()] == [f"{sha}.png"]
+
+
+def test_near_duplicate_keeps_the_stored_object_in_sha(tmp_path, monkeypatch):
+    monkeypatch.setattr(screenshot_store, 'difference_hash', lambda data: 'f' * 16 if data == b'a' else 'f' * 15 + 'e')
+    store = screenshot_store.ScreenshotStore(root=str(tmp_path), phash_distance=0)
+    store.phash_distance = 4
+    first = store.put(b'a', 'a.png')
+    second = store.put(b'b', 'b.png')
+    entry = screenshot_store.read_manifest(str(tmp_path))[1]
+    assert second == entry['sha'] == first
+    assert entry['captured_sha'] == hashlib.sha256(b'b').hexdigest()
+    assert 'stored' not in entry
@@ -0,0 +1,34 @@
+"""The local app server serves the app and nothing else"""
+import urllib.error
+import urllib.request
+
+import pytest
+
+from cleancity_testkit import server
+
+
+@pytest.fixture
+def app_url():
+    app = server.AppServer().start()
+    yield app.url
+    app.stop()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.read()
+
+
+def test_app_files_and_routes_are_served(app_url):
+    with open(f"{server.APP_ROOT}/index.html", 'rb') as f:
+        index = f.read()
+    assert fetch(f"{app_url}/") == (200, index)
+    assert fetch(f"{app_url}/dashboard") == (200, index)
+    assert fetch(f"{app_url}/script.js")[0] == 200
+
+
+@pytest.mark.parametrize('path', ['/.git/config', '/conftest.py', '/.cache/durations.json', '/requirements.txt'])
+def test_other_repository_files_are_not_served(app_url, path):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(f"{app_url}{path}")
+    assert error.value.code == 404
@@ -0,0 +1,90 @@
+"""Condition waits against a fake browser"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from cleancity_testkit import waits
+
+MESSAGE = (By.CSS_SELECTOR, '.alert')
+ROWS = (By.CSS_SELECTOR, '#requests-tbody tr')
+
+
+class FakeElement:
+    def __init__(self, displayed=True):
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class FakeDriver:
+    """Replays a scripted sequence of (url, {locator: elements}) states, one per poll"""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.polls = 0
+
+    def _state(self):
+        return self.states[min(self.polls, len(self.states) - 1)]
+
+    @property
+    def current_url(self):
+        return self._state()[0]
+
+    def find_elements(self, by, value):
+        elements = self._state()[1].get((by, value), [])
+        self.polls += 1
+        return elements
+
+
+def test_submitted_returns_when_a_message_shows():
+    driver = FakeDriver([('http://app/', {MESSAGE: [FakeElement(False)]}),
+                         ('http://app/', {MESSAGE: [FakeElement(True)]})])
+    assert waits.submitted(driver, 'http://app/', MESSAGE, timeout=2)
+
+
+def test_submitted_returns_when_the_url_changes():
+    driver = FakeDriver([('http://app/login', {})])
+    assert waits.submitted(driver, 'http://app/register', MESSAGE, timeout=2)
+
+
+def test_submitted_times_out_without_a_response():
+    driver = FakeDriver([('http://app/', {MESSAGE: [FakeElement(False)]})])
+    with pytest.raises(TimeoutException):
+        waits.submitted(driver, 'http://app/', MESSAGE, timeout=0.2)
+
+
+def test_element_count_stable_waits_for_the_list_to_stop_growing():
+    rows = [[FakeElement()] * count for count in (0, 2, 3)]
+    driver = FakeDriver([('http://app/', {ROWS: rows[0]}), ('http://app/', {ROWS: rows[1]}),
+                         ('http://app/', {ROWS: rows[2]})])
+    assert waits.element_count_stable(driver, ROWS, stable_ms=100, timeout=2) == 3
+
+
+def test_url_changed_returns_the_new_url():
+    driver = FakeDriver([('http://app/login', {})])
+    assert waits.url_changed(driver, 'http://app/register', timeout=2) == 'http://app/login'
+
+
+class ScriptDriver:
+    """Answers the app-hook scripts from a scripted sequence of results"""
+
+    def __init__(self, script, results):
+        self.script = script
+        self.results = list(results)
+
+    def execute_script(self, script, *args):
+        assert script == self.script
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def test_no_pending_timers_waits_for_short_timers_to_run():
+    driver = ScriptDriver(waits.PENDING_TIMERS_SCRIPT, [2, 1, 0])
+    assert waits.no_pending_timers(driver, timeout=2)
+    assert driver.results == [0]
+
+
+def test_dom_quiescent_times_out_while_the_dom_keeps_changing():
+    driver = ScriptDriver(waits.MS_SINCE_MUTATION_SCRIPT, [10])
+    with pytest.raises(TimeoutException):
+        waits.dom_quiescent(driver, quiet_ms=150, timeout=0.2)